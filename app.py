@@ -1,5 +1,6 @@
 import streamlit as st
-import pandas as pd
+
+from utils import content, data_store, instrumentation
 
 # ============================================================================
 # PAGE CONFIG
@@ -12,6 +13,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+instrumentation.begin_page("app")
+
 # ============================================================================
 # CUSTOM CSS - NETFLIX THEME
 # ============================================================================
@@ -126,12 +129,11 @@ st.markdown("""
 # LOAD PLATFORM STATISTICS
 # ============================================================================
 
-@st.cache_data
 def load_platform_stats():
-    try:
-        stats = pd.read_csv('assets/data/summary/platform_stats.csv')
-        return stats.iloc[0]
-    except:
+    with instrumentation.track("loader", "load_platform_stats"):
+        summary = data_store.current().summary
+        if summary is not None:
+            return summary['platform_stats'].iloc[0]
         # Fallback if file not found
         return {
             'total_ratings': '33.8M',
@@ -206,53 +208,12 @@ col1, col2 = st.columns([2, 1])
 with col1:
     st.markdown("<h2>PROJECT OVERVIEW</h2>", unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 2rem; border-radius: 8px; border: 1px solid #333;'>
-        <h3>Business Context</h3>
-        <p style='font-size: 1.1rem; line-height: 1.8;'>
-        As Data Scientists for a leading streaming platform, we analyzed <strong>33.8 million ratings</strong> 
-        from <strong>331,000 users</strong> across <strong>86,000 movies</strong> to extract actionable insights 
-        for content strategy, user engagement, and personalized recommendations.
-        </p>       
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.PROJECT_OVERVIEW, unsafe_allow_html=True)
 
 with col2:
     st.markdown("<h2>NAVIGATION</h2>", unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 2rem; border-radius: 8px; border: 1px solid #333;'>
-        <h3>Dashboard Sections</h3>
-        <ul style='font-size: 1.1rem; line-height: 2;'>
-            <li>👥 <strong>User Behavior</strong>
-                <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
-                    <li>Rating patterns</li>
-                    <li>Temporal trends</li>
-                    <li>User retention</li>
-                </ul>
-            </li>
-            <li>🎬 <strong>Content Performance</strong>
-                <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
-                    <li>Genre analysis</li>
-                    <li>Tag sentiment</li>
-                    <li>Release year impact</li>
-                </ul>
-            </li>
-            <li>💎 <strong>Hidden Gems</strong>
-                <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
-                    <li>Underrated movies</li>
-                    <li>Quality vs popularity</li>
-                </ul>
-            </li>
-            <li>🎭 <strong>User Personas</strong>
-                <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
-                    <li>Genre preferences</li>
-                    <li>Clustering analysis</li>
-                </ul>
-            </li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.NAVIGATION, unsafe_allow_html=True)
 
 st.markdown("<hr>", unsafe_allow_html=True)
 
@@ -265,35 +226,13 @@ st.markdown("<h2 style='text-align: center;'>KEY INSIGHTS</h2>", unsafe_allow_ht
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914; height: 200px;'>
-        <h3>👥 User Behavior</h3>
-        <p>• 3 distinct user segments identified</p>
-        <p>• Peak activity: 8-10 PM weekdays</p>
-        <p>• 28-year rating history analyzed</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.HOME_INSIGHT_USERS, unsafe_allow_html=True)
 
 with col2:
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914; min-height: 200px;'>
-        <h3>🎬 Content Insights</h3>
-        <p>• Film-Noir highest rated genre (4.0★)</p>
-        <p>• IMAX format: +1.9% rating boost</p>
-        <p>• 1940s golden age of cinema</p>
-        <p>• 194 hidden gems discovered</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.HOME_INSIGHT_CONTENT, unsafe_allow_html=True)
 
 with col3:
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914; height: 200px;'>
-        <h3>🎯 Recommendations</h3>
-        <p>• 5 user personas identified</p>
-        <p>• ML models: 66% Precision@10</p>
-        <p>• Personalization opportunities</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.HOME_INSIGHT_RECOMMENDATIONS, unsafe_allow_html=True)
 
 st.markdown("<hr>", unsafe_allow_html=True)
 
@@ -329,4 +268,6 @@ st.markdown("""
     <p>Built with Streamlit • Plotly • Pandas • Scikit-learn</p>
     
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+instrumentation.end_page()
@@ -1,9 +1,10 @@
 import streamlit as st
-import pandas as pd
 import os
 from pathlib import Path
 from PIL import Image
 
+from utils import content, data_store, genre_matrix, instrumentation, leaderboard, release_year, schema
+
 # ============================================================================
 # PAGE CONFIG
 # ============================================================================
@@ -15,6 +16,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+instrumentation.begin_page("business_insights")
+
 # ============================================================================
 # CUSTOM CSS - NETFLIX THEME (Same as app.py)
 # ============================================================================
@@ -72,27 +75,30 @@ st.markdown("""
 # DATA LOADING
 # ============================================================================
 
-@st.cache_data
+# Summary tables and assets come from a process-wide snapshot that is warmed
+# on first use and refreshed in the background; this run sticks to one version.
+snapshot = data_store.current()
+
 def load_summary_data():
     """Load all summary CSV files"""
-    try:
-        return {
-            'platform_stats': pd.read_csv('assets/data/summary/platform_stats.csv'),
-            'user_segments': pd.read_csv('assets/data/summary/user_segments.csv'),
-            'yearly_trends': pd.read_csv('assets/data/summary/yearly_trends.csv'),
-            'genre_stats': pd.read_csv('assets/data/summary/genre_stats.csv'),
-            'hidden_gems': pd.read_csv('assets/data/summary/hidden_gems.csv'),
-            'top_movies': pd.read_csv('assets/data/summary/top_movies.csv')
-        }
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return None
+    with instrumentation.track("loader", "load_summary_data") as span:
+        if snapshot.summary_error is not None:
+            st.error(f"Error loading data: {snapshot.summary_error}")
+        data = snapshot.summary
+        if span and data:
+            span.bytes = sum(int(df.memory_usage(deep=True).sum()) for df in data.values())
+    return data
 
 def load_html_viz(filepath):
     """Load and display HTML visualization"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        with instrumentation.track("loader", f"load_html_viz:{Path(filepath).stem}") as span:
+            html_content = snapshot.html.get(filepath)
+            if html_content is None:
+                instrumentation.mark_miss()
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    html_content = f.read()
+            span.bytes = len(html_content)
         return html_content
     except Exception as e:
         st.error(f"Could not load visualization: {filepath}")
@@ -146,6 +152,7 @@ tabs = st.tabs([
     "👥 User Behavior", 
     "🎬 Content Performance", 
     "💎 Hidden Gems",
+    "🏆 Leaderboards",
     "🎭 User Personas",
     "📥 Export Data"
 ])
@@ -154,22 +161,16 @@ tabs = st.tabs([
 # TAB 1: USER BEHAVIOR
 # ============================================================================
 
-with tabs[0]:
+with tabs[0], instrumentation.track("section", "user_behavior"):
     st.markdown("<h2>👥 User Behavior Analysis</h2>", unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
-        <p style='font-size: 1.05rem;'>
-        Understanding user rating patterns, temporal trends, and engagement behaviors across our platform.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.INTRO_USER_BEHAVIOR, unsafe_allow_html=True)
     
     # User Behavior Overview
     st.markdown("### User Rating Distribution")
     html_content = load_html_viz('assets/visualizations/user_behavior/overview.html')
     if html_content:
-        st.components.v1.html(html_content, height=550, scrolling=False)
+        instrumentation.render_html(html_content, height=550, name="overview")
     
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     
@@ -177,7 +178,7 @@ with tabs[0]:
     st.markdown("### Rating Trends Over Time (1995-2023)")
     html_content = load_html_viz('assets/visualizations/user_behavior/temporal_trends.html')
     if html_content:
-        st.components.v1.html(html_content, height=850, scrolling=False)
+        instrumentation.render_html(html_content, height=850, name="temporal_trends")
     
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     
@@ -185,7 +186,7 @@ with tabs[0]:
     st.markdown("### User Retention Analysis")
     html_content = load_html_viz('assets/visualizations/user_behavior/retention.html')
     if html_content:
-        st.components.v1.html(html_content, height=550, scrolling=False)
+        instrumentation.render_html(html_content, height=550, name="retention")
     
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     
@@ -196,13 +197,13 @@ with tabs[0]:
         st.markdown("### Monthly Activity Patterns")
         html_content = load_html_viz('assets/visualizations/user_behavior/monthly_patterns.html')
         if html_content:
-            st.components.v1.html(html_content, height=550, scrolling=False)
+            instrumentation.render_html(html_content, height=550, name="monthly_patterns")
     
     with col2:
         st.markdown("### Hourly Activity Patterns")
         html_content = load_html_viz('assets/visualizations/user_behavior/hourly_patterns.html')
         if html_content:
-            st.components.v1.html(html_content, height=550, scrolling=False)
+            instrumentation.render_html(html_content, height=550, name="hourly_patterns")
     
     # Key Insights
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
@@ -211,60 +212,68 @@ with tabs[0]:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
-            <h4>User Segments</h4>
-            <p>• Harsh Raters: <strong>8.5%</strong></p>
-            <p>• Neutral Raters: <strong>73.2%</strong></p>
-            <p>• Generous Raters: <strong>18.3%</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.INSIGHT_USER_SEGMENTS, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
-            <h4>Peak Activity</h4>
-            <p>• Time: <strong>8-10 PM</strong></p>
-            <p>• Day: <strong>Weekdays</strong></p>
-            <p>• Month: <strong>October</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.INSIGHT_PEAK_ACTIVITY, unsafe_allow_html=True)
     
     with col3:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
-            <h4>Trends</h4>
-            <p>• 28-year history</p>
-            <p>• Steady growth since 1995</p>
-            <p>• Peak: 2016-2018</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.INSIGHT_TRENDS, unsafe_allow_html=True)
 
 # ============================================================================
 # TAB 2: CONTENT PERFORMANCE
 # ============================================================================
 
-with tabs[1]:
+with tabs[1], instrumentation.track("section", "content_performance"):
     st.markdown("<h2>🎬 Content Performance & Tag Analysis</h2>", unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
-        <p style='font-size: 1.05rem;'>
-        Analyzing genre performance, user-generated tags, and release year impact on ratings.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.INTRO_CONTENT_PERFORMANCE, unsafe_allow_html=True)
     
     # Genre Performance
     st.markdown("### Genre Performance Analysis")
     html_content = load_html_viz('assets/visualizations/content_performance/genre_performance.html')
     if html_content:
-        st.components.v1.html(html_content, height=700, scrolling=False)
+        instrumentation.render_html(html_content, height=700, name="genre_performance")
     else:
         st.warning("Genre performance visualization not found. Check file path.")
     
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     
+    # Genre Combinations
+    st.markdown("### Genre Combinations & Audience Overlap")
+    if data and 'genre_pairs' in data:
+        genre_pairs = data['genre_pairs']
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = genre_matrix.heatmap(
+                genre_pairs, 'avg_rating', "Avg Rating",
+                "Average rating of movies carrying both genres"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            fig = genre_matrix.heatmap(
+                genre_pairs, 'user_affinity', "Affinity",
+                "Audience overlap (cosine similarity of user genre profiles)"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown("#### Best-Performing Genre Pairs")
+        combos = genre_pairs[
+            (genre_pairs['genre_a'] != genre_pairs['genre_b']) & (genre_pairs['num_ratings'] >= 10000)
+        ]
+        st.dataframe(
+            combos.nlargest(15, 'avg_rating'),
+            use_container_width=True,
+            hide_index=True
+        )
+    else:
+        st.info("Genre combination data not built yet. Run `python -m utils.genre_matrix build`.")
+    
+    st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
+    
     # Tag Analysis
     col1, col2 = st.columns([1, 1])
 
@@ -272,7 +281,7 @@ with tabs[1]:
         st.markdown("### Tag Sentiment Analysis")
         html_content = load_html_viz('assets/visualizations/content_performance/tag_sentiment.html')
         if html_content:
-            st.components.v1.html(html_content, height=550, scrolling=False)
+            instrumentation.render_html(html_content, height=550, name="tag_sentiment")
 
     with col2:
         st.markdown("### Popular Movie Tags")
@@ -280,7 +289,13 @@ with tabs[1]:
         wordcloud_path = 'assets/visualizations/content_performance/tag_wordcloud.png'
         
         try:
-            img = Image.open(wordcloud_path)
+            with instrumentation.track("loader", "tag_wordcloud") as span:
+                img = snapshot.images.get(wordcloud_path)
+                if img is None:
+                    instrumentation.mark_miss()
+                    img = Image.open(wordcloud_path)
+                if span:
+                    span.bytes = img.width * img.height * len(img.getbands())
             st.image(img, use_column_width=True)
         except FileNotFoundError:
             st.error(f"❌ File not found: {wordcloud_path}")
@@ -292,9 +307,47 @@ with tabs[1]:
     
     # Release Year Impact
     st.markdown("### Release Year Impact Analysis")
-    html_content = load_html_viz('assets/visualizations/content_performance/release_year_impact.html')
-    if html_content:
-        st.components.v1.html(html_content, height=900, scrolling=False)
+    if data and 'release_years' in data and 'release_decades' in data:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        
+        with col1:
+            granularity = st.radio("Group by", ["Decade", "Year"], horizontal=True)
+        
+        if granularity == "Decade":
+            stats, column = data['release_decades'], 'decade'
+        else:
+            stats, column = data['release_years'], 'release_year'
+        first, last = int(stats[column].min()), int(stats[column].max())
+        
+        with col2:
+            start, end = st.slider(
+                "Release years", min_value=first, max_value=last, value=(first, last),
+                step=10 if granularity == "Decade" else 1
+            )
+        with col3:
+            min_ratings = st.number_input(
+                "Min ratings per period", min_value=0, value=1000, step=1000
+            )
+        
+        stats = stats[stats[column].between(start, end) & (stats['num_ratings'] >= min_ratings)]
+        st.plotly_chart(
+            release_year.figure(stats, column, f"Ratings by release {granularity.lower()}"),
+            use_container_width=True
+        )
+        
+        best = release_year.best_period(stats)
+        if best is not None:
+            label = f"{int(best[column])}s" if granularity == "Decade" else f"{int(best[column])}"
+            st.caption(
+                f"Best-rated {granularity.lower()} in this view: {label} — "
+                f"{best['avg_rating']:.2f}★ over {int(best['num_ratings']):,} ratings "
+                f"of {int(best['num_movies']):,} movies, rated on average "
+                f"{best['avg_rating_lag']:.1f} years after release."
+            )
+    else:
+        html_content = load_html_viz('assets/visualizations/content_performance/release_year_impact.html')
+        if html_content:
+            instrumentation.render_html(html_content, height=900, name="release_year_impact")
     
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     
@@ -302,28 +355,13 @@ with tabs[1]:
     st.markdown("### Movie Polarization Analysis")
     html_content = load_html_viz('assets/visualizations/content_performance/polarization.html')
     if html_content:
-        st.components.v1.html(html_content, height=650, scrolling=False)
+        instrumentation.render_html(html_content, height=650, name="polarization")
     
     # Premium Effect - IMAX Insight
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     st.markdown("### Premium Effect: Technical Format Impact")
     
-    st.markdown("""
-    Technical format significantly influences subscriber satisfaction. IMAX-formatted movies demonstrate 
-    measurable performance advantages over standard releases.
-    """)
-    
-    st.markdown("**Key Data Points:**")
-    st.markdown("- **Statistical Outperformance:** IMAX-formatted movies outperform standard releases by **1.9%**")
-    st.markdown("- **Rating Comparison:** IMAX titles hold an average rating of **3.607 stars**, compared to **3.539 stars** for standard releases")
-    st.markdown("- **Statistical Significance:** The difference in ratings is statistically valid, with a **p-value under 0.05**")
-    
-    st.markdown("**Strategic Recommendation:**")
-    st.markdown("""
-    **Content Acquisition Strategy:** The platform should prioritize licensing IMAX-format releases 
-    when possible to maximize user satisfaction and engagement. This premium format investment directly correlates 
-    with improved subscriber experience.
-    """)
+    st.markdown(content.PREMIUM_EFFECT, unsafe_allow_html=True)
     
     # Key Insights
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
@@ -332,55 +370,28 @@ with tabs[1]:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
-            <h4>Top Genres</h4>
-            <p>• Film-Noir: <strong>4.00★</strong></p>
-            <p>• Documentary: <strong>3.95★</strong></p>
-            <p>• War: <strong>3.93★</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.INSIGHT_TOP_GENRES, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
-            <h4>Golden Era</h4>
-            <p>• Best decade: <strong>1940s</strong></p>
-            <p>• Peak rating: <strong>3.85★</strong></p>
-            <p>• Classic cinema dominance</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.INSIGHT_GOLDEN_ERA, unsafe_allow_html=True)
     
     with col3:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
-            <h4>Tag Insights</h4>
-            <p>• Positive tags: <strong>2.2%</strong></p>
-            <p>• Neutral tags: <strong>96.5%</strong></p>
-            <p>• Negative tags: <strong>1.3%</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.INSIGHT_TAGS, unsafe_allow_html=True)
 
 # ============================================================================
 # TAB 3: HIDDEN GEMS
 # ============================================================================
 
-with tabs[2]:
+with tabs[2], instrumentation.track("section", "hidden_gems"):
     st.markdown("<h2>💎 Hidden Gems Discovery</h2>", unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
-        <p style='font-size: 1.05rem;'>
-        High-quality movies (≥4.0★) with low visibility (10-100 ratings) - perfect for curation and promotion.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.INTRO_HIDDEN_GEMS, unsafe_allow_html=True)
     
     # Hidden Gems Visualization
     st.markdown("### Top Hidden Gems")
     html_content = load_html_viz('assets/visualizations/hidden_gems/gems_analysis.html')
     if html_content:
-        st.components.v1.html(html_content, height=800, scrolling=False)
+        instrumentation.render_html(html_content, height=800, name="gems_analysis")
     
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     
@@ -391,7 +402,7 @@ with tabs[2]:
         hidden_gems_df = data['hidden_gems'].head(50)
         
         st.dataframe(
-            hidden_gems_df[['title', 'genres', 'release_year', 'avg_rating', 'num_ratings']],
+            schema.for_display(hidden_gems_df[['title', 'genres', 'release_year', 'avg_rating', 'num_ratings']]),
             use_container_width=True,
             height=400
         )
@@ -412,25 +423,62 @@ with tabs[2]:
             st.metric("Top Genre", top_genre)
 
 # ============================================================================
-# TAB 4: USER PERSONAS
+# TAB 4: LEADERBOARDS
+# ============================================================================
+
+with tabs[3], instrumentation.track("section", "leaderboards"):
+    st.markdown("<h2>🏆 Movie Leaderboards</h2>", unsafe_allow_html=True)
+    
+    st.markdown(content.INTRO_LEADERBOARDS, unsafe_allow_html=True)
+    
+    movie_table, movie_version = leaderboard.load_movie_table()
+    
+    if movie_table is not None:
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            lb_genre = st.selectbox("Genre", [leaderboard.ANY] + movie_table.genre_names)
+        with col2:
+            lb_decade = st.selectbox(
+                "Decade", [leaderboard.ANY] + movie_table.decades,
+                format_func=lambda d: d if d == leaderboard.ANY else f"{d}s"
+            )
+        with col3:
+            lb_type = st.selectbox("Content Type", [leaderboard.ANY] + leaderboard.CONTENT_TYPES)
+        with col4:
+            lb_k = st.number_input("Top K", min_value=1, max_value=500, value=20)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            lb_min = st.number_input("Minimum Ratings", min_value=0, value=50, step=50)
+        with col2:
+            lb_weight = st.number_input("Prior Weight (m)", min_value=0, value=leaderboard.DEFAULT_PRIOR_WEIGHT, step=50)
+        with col3:
+            lb_mean = st.number_input("Prior Mean (C)", min_value=0.5, max_value=5.0, value=round(movie_table.prior_mean, 2), step=0.05)
+        
+        board = leaderboard.leaderboard(
+            movie_version, movie_table, int(lb_k), lb_genre, lb_decade, lb_type,
+            int(lb_min), int(lb_weight), float(lb_mean)
+        )
+        
+        st.caption(f"Ranking {len(movie_table):,} movies")
+        st.dataframe(board, use_container_width=True, height=500, hide_index=True)
+
+# ============================================================================
+# TAB 5: USER PERSONAS
 # ============================================================================
 
-with tabs[3]:
+with tabs[4], instrumentation.track("section", "user_personas"):
     st.markdown("<h2>🎭 User Personas & Segmentation</h2>", unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
-        <p style='font-size: 1.05rem;'>
-        K-Means clustering analysis revealing distinct user segments based on genre preferences.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.INTRO_USER_PERSONAS, unsafe_allow_html=True)
     
     # User Personas Visualization
     st.markdown("### User Persona Distribution")
     html_content = load_html_viz('assets/visualizations/user_personas/persona_clusters.html')
     if html_content:
-        st.components.v1.html(html_content, height=800, scrolling=False)
+        instrumentation.render_html(html_content, height=800, name="persona_clusters")
     
     st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
     
@@ -440,61 +488,19 @@ with tabs[3]:
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
-            <h4>🎭 Drama Enthusiasts (27.0%)</h4>
-            <p>Prefers: Drama, Romance, Thriller</p>
-            <p>Characteristics: Emotional, character-driven stories</p>
-        </div>
-        
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
-            <h4>🎬 Mainstream Viewers (25.1%)</h4>
-            <p>Prefers: Comedy, Drama, Action</p>
-            <p>Characteristics: Popular, accessible content</p>
-        </div>
-        
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px;'>
-            <h4>🚀 Sci-Fi Fans (10.0%)</h4>
-            <p>Prefers: Sci-Fi, Action, Fantasy</p>
-            <p>Characteristics: Speculative, futuristic themes</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.PERSONAS_LEFT, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
-            <h4>🎨 Art House Lovers (28.4%)</h4>
-            <p>Prefers: Documentary, Film-Noir, Independent</p>
-            <p>Characteristics: Intellectual, artistic films</p>
-        </div>
-        
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
-            <h4>👨‍👩‍👧‍👦 Family Oriented (9.5%)</h4>
-            <p>Prefers: Animation, Children, Comedy</p>
-            <p>Characteristics: All-ages, wholesome content</p>
-        </div>
-        
-        <div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px;'>
-            <h4>💡 Strategic Value</h4>
-            <p>Enable persona-specific homepage experiences</p>
-            <p>Expected impact: 15-25% engagement increase</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(content.PERSONAS_RIGHT, unsafe_allow_html=True)
 
 # ============================================================================
-# TAB 5: EXPORT DATA
+# TAB 6: EXPORT DATA
 # ============================================================================
 
-with tabs[4]:
+with tabs[5], instrumentation.track("section", "export_data"):
     st.markdown("<h2>📥 Export & Download Data</h2>", unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
-        <p style='font-size: 1.05rem;'>
-        Download summary data and insights for further analysis or reporting.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(content.INTRO_EXPORT_DATA, unsafe_allow_html=True)
     
     if data:
         col1, col2 = st.columns(2)
@@ -504,21 +510,21 @@ with tabs[4]:
             
             st.download_button(
                 label="📈 Platform Statistics",
-                data=data['platform_stats'].to_csv(index=False),
+                data=data_store.source_csv(snapshot, 'platform_stats'),
                 file_name="platform_stats.csv",
                 mime="text/csv"
             )
             
             st.download_button(
                 label="👥 User Segments",
-                data=data['user_segments'].to_csv(index=False),
+                data=data_store.source_csv(snapshot, 'user_segments'),
                 file_name="user_segments.csv",
                 mime="text/csv"
             )
             
             st.download_button(
                 label="📅 Yearly Trends",
-                data=data['yearly_trends'].to_csv(index=False),
+                data=data_store.source_csv(snapshot, 'yearly_trends'),
                 file_name="yearly_trends.csv",
                 mime="text/csv"
             )
@@ -528,24 +534,39 @@ with tabs[4]:
             
             st.download_button(
                 label="🎭 Genre Statistics",
-                data=data['genre_stats'].to_csv(index=False),
+                data=data_store.source_csv(snapshot, 'genre_stats'),
                 file_name="genre_stats.csv",
                 mime="text/csv"
             )
             
             st.download_button(
                 label="💎 Hidden Gems",
-                data=data['hidden_gems'].to_csv(index=False),
+                data=data_store.source_csv(snapshot, 'hidden_gems'),
                 file_name="hidden_gems.csv",
                 mime="text/csv"
             )
             
             st.download_button(
                 label="🏆 Top Movies",
-                data=data['top_movies'].to_csv(index=False),
+                data=data_store.source_csv(snapshot, 'top_movies'),
                 file_name="top_movies.csv",
                 mime="text/csv"
             )
+        
+        with st.expander("🗜️ In-Memory Footprint"):
+            st.dataframe(
+                [
+                    {
+                        'table': name,
+                        'default dtypes (KB)': round(before / 1024, 1),
+                        'compact dtypes (KB)': round(after / 1024, 1),
+                        'saved': f"{1 - after / before:.0%}" if before else "-",
+                    }
+                    for name, (before, after) in snapshot.memory.items()
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
 
 # ============================================================================
 # FOOTER
@@ -557,4 +578,6 @@ st.markdown("""
 <div style='text-align: center; padding: 2rem; color: #666;'>
     <p>Business Insights Dashboard | MovieLens 33M Dataset Analysis</p>    
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+instrumentation.end_page()
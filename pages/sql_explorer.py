@@ -0,0 +1,216 @@
+import streamlit as st
+
+from utils import approx, instrumentation, sql_explorer
+
+# ============================================================================
+# PAGE CONFIG
+# ============================================================================
+
+st.set_page_config(
+    page_title="SQL Explorer | MovieLens Dashboard",
+    page_icon="🔎",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+instrumentation.begin_page("sql_explorer")
+
+# ============================================================================
+# CUSTOM CSS - NETFLIX THEME (Same as app.py)
+# ============================================================================
+
+st.markdown("""
+<style>
+    .stApp { background-color: #141414; }
+    .main { background-color: #141414; }
+    section[data-testid="stSidebar"] {
+        background-color: #000000;
+        border-right: 2px solid #E50914;
+    }
+    h1, h2, h3 { color: #FFFFFF !important; font-family: 'Helvetica Neue', Arial, sans-serif; }
+    h1 { color: #E50914 !important; font-weight: 700; }
+    p, li, span, div { color: #FFFFFF !important; }
+    [data-testid="stMetricValue"] { color: #E50914 !important; font-size: 1.5rem !important; }
+    .stButton button {
+        background-color: #E50914;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 10px 24px;
+        font-weight: 600;
+    }
+    .stButton button:hover { background-color: #F40612; }
+    hr { border-color: #E50914 !important; opacity: 0.3; }
+    
+    /* Tabs styling */
+    .stTabs [data-baseweb="tab-list"] {
+        background-color: #1a1a1a;
+        border-radius: 8px 8px 0 0;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        color: #999 !important;
+        background-color: transparent;
+        border: none;
+        padding: 1rem 2rem;
+        font-weight: 600;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        color: #E50914 !important;
+        border-bottom: 3px solid #E50914;
+    }
+    
+    .stTabs [data-baseweb="tab-panel"] {
+        background-color: #141414;
+        padding: 2rem 1rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# ============================================================================
+# HEADER
+# ============================================================================
+
+st.markdown("""
+<div style='text-align: center; padding: 1.5rem 0;'>
+    <h1 style='font-size: 3rem;'>🔎 SQL EXPLORER</h1>
+    <p style='font-size: 1.1rem; color: #999;'>
+        Ad-hoc slices over the MovieLens tables | Cached, row-limited, read-only
+    </p>
+</div>
+<hr>
+""", unsafe_allow_html=True)
+
+_, tables, data_version = sql_explorer.current_engine()
+
+with st.expander("📚 Available tables"):
+    for table, columns in tables.items():
+        st.markdown(f"**{table}**: " + ", ".join(f"`{name}` {dtype}" for name, dtype in columns))
+    if 'ratings' not in tables:
+        st.info(
+            f"Export `ratings.parquet` and `movies.parquet` to `{sql_explorer.RAW_DIR}/` "
+            "to query the full ratings table."
+        )
+
+# ============================================================================
+# QUICK SLICES (APPROXIMATE)
+# ============================================================================
+
+st.markdown("<h2>⚡ Quick Slices</h2>", unsafe_allow_html=True)
+
+synopses = approx.load_synopses()
+if synopses is None:
+    st.info("Approximate synopses not built yet. Run `python -m utils.approx build` to enable quick slices.")
+else:
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        start_year, end_year = st.slider(
+            "Rating years", *synopses.year_range, value=synopses.year_range
+        )
+    with col2:
+        genre = st.selectbox("Genre", [approx.ALL] + synopses.genre_names)
+
+    users, mean, median, p90 = synopses.quick_slice(start_year, end_year, genre)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Active Users ≈", f"{users[0]:,.0f}")
+        st.caption(f"95% CI {users[1]:,.0f} – {users[2]:,.0f}")
+    if mean is not None:
+        with col2:
+            st.metric("Avg Rating ≈", f"{mean[0]:.3f}★")
+            st.caption(f"95% CI {mean[1]:.3f} – {mean[2]:.3f}")
+        with col3:
+            st.metric("Median Rating ≈", f"{median[0]:.1f}★")
+            st.caption(f"95% CI {median[1]:.1f} – {median[2]:.1f}")
+        with col4:
+            st.metric("90th Percentile ≈", f"{p90[0]:.1f}★")
+            st.caption(f"95% CI {p90[1]:.1f} – {p90[2]:.1f}")
+
+    if st.button("Compute Exact Values"):
+        if 'ratings' not in tables or 'movies' not in tables:
+            st.warning("Exact values need the raw `ratings` and `movies` tables.")
+        else:
+            try:
+                exact = sql_explorer.run_query(
+                    approx.EXACT_SQL,
+                    {'start_year': start_year, 'end_year': end_year, 'genre': genre},
+                    timeout_seconds=300,
+                )
+                st.dataframe(exact['df'], use_container_width=True, hide_index=True)
+            except sql_explorer.QueryError as e:
+                st.error(f"Query failed: {e}")
+
+st.markdown("<hr>", unsafe_allow_html=True)
+
+# ============================================================================
+# QUERY BUILDER
+# ============================================================================
+
+templates = {
+    name: template for name, template in sql_explorer.TEMPLATES.items()
+    if all(table in tables for table in template['requires'])
+}
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    choice = st.selectbox("Query template", list(templates) + ["Custom SQL"])
+
+with col2:
+    row_limit = st.number_input("Row limit", min_value=1, max_value=100000, value=sql_explorer.DEFAULT_ROW_LIMIT)
+    timeout_seconds = st.number_input("Timeout (seconds)", min_value=1, max_value=300, value=sql_explorer.DEFAULT_TIMEOUT_SECONDS)
+
+params = {}
+if choice in templates:
+    template = templates[choice]
+    param_cols = st.columns(max(len(template['params']), 1))
+    for col, (name, default) in zip(param_cols, template['params'].items()):
+        with col:
+            if isinstance(default, int):
+                params[name] = int(st.number_input(name, value=default, step=1))
+            else:
+                params[name] = st.text_input(name, value=default)
+    sql = st.text_area("SQL", value=template['sql'].strip(), height=260, disabled=True)
+else:
+    sql = st.text_area("SQL", value="SELECT * FROM genre_stats ORDER BY avg_rating DESC", height=260)
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+if st.button("Run Query"):
+    try:
+        result = sql_explorer.run_query(sql, params, row_limit, timeout_seconds)
+    except sql_explorer.QueryError as e:
+        st.error(f"Query failed: {e}")
+    else:
+        source = "cache" if result['cached'] else "engine"
+        st.caption(
+            f"{len(result['df'])} rows • {result['seconds'] * 1000:.0f} ms in engine • "
+            f"served from {source} • data version {data_version}"
+        )
+        if result['truncated']:
+            st.warning(f"Result truncated to {row_limit} rows.")
+        st.dataframe(result['df'], use_container_width=True, height=450)
+        st.download_button(
+            label="📥 Download CSV",
+            data=result['df'].to_csv(index=False),
+            file_name="query_result.csv",
+            mime="text/csv"
+        )
+
+# ============================================================================
+# FOOTER
+# ============================================================================
+
+st.markdown("<hr>", unsafe_allow_html=True)
+
+st.markdown("""
+<div style='text-align: center; padding: 2rem; color: #666;'>
+    <p>SQL Explorer | MovieLens 33M Dataset Analysis</p>
+</div>
+""", unsafe_allow_html=True)
+
+instrumentation.end_page()
@@ -0,0 +1,158 @@
+"""Approximate aggregates checked against exact values on synthetic ratings."""
+
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import approx
+
+YEARS = [2000, 2001, 2002, 2003, 2004]
+GENRES = ['Comedy', 'Drama', 'Comedy|Drama', 'Horror', '(no genres listed)']
+
+
+def _population(seed=0, per_year=4000, users=3000, movies=200):
+    """Ratings whose level depends on the year and on the movie's genres."""
+    rng = np.random.default_rng(seed)
+    movie_table = pd.DataFrame({
+        'movieId': np.arange(1, movies + 1),
+        'genres': np.asarray(GENRES, dtype=object)[rng.integers(0, len(GENRES), movies)],
+    })
+    year = np.repeat(YEARS, per_year)
+    movie_ids = rng.integers(1, movies + 1, len(year))
+    drama = movie_table['genres'].str.contains('Drama').to_numpy()[movie_ids - 1]
+    # Continuous ratings so quantiles are not pinned to a few discrete values.
+    rating = 3.0 + 0.1 * (year - 2000) + 0.5 * drama + rng.normal(0, 0.8, len(year))
+    ratings = pd.DataFrame({
+        'userId': rng.integers(1, users + 1, len(year)),
+        'movieId': movie_ids,
+        'rating': rating,
+        'timestamp': np.array([f"{y}-03-01" for y in year], dtype='datetime64[s]').astype(np.int64)
+        + rng.integers(0, 86400 * 200, len(year)),
+    })
+    return ratings, movie_table
+
+
+def _exact(ratings, movies, start_year, end_year, genre):
+    years = pd.to_datetime(ratings['timestamp'], unit='s').dt.year
+    genres = ratings['movieId'].map(movies.set_index('movieId')['genres'])
+    mask = years.between(start_year, end_year)
+    if genre != approx.ALL:
+        mask &= genres.str.split('|').apply(lambda gs: genre in gs)
+    return ratings[mask]
+
+
+def _synopses(tmp_path, ratings, movies, per_stratum, seed=0):
+    approx.build(ratings, movies, str(tmp_path), per_stratum, seed=seed)
+    return approx.read_synopses(
+        tmp_path / approx.SKETCH_FILE, tmp_path / approx.SAMPLE_FILE
+    )
+
+
+# ============================================================================
+# HYPERLOGLOG
+# ============================================================================
+
+def test_hll_rank_matches_leading_zeros():
+    p = approx.HLL_PRECISION
+    hashes = approx.hash64(np.arange(5000))
+    # Edge cases: nothing left after the index bits, and a single low bit.
+    hashes = np.concatenate([hashes, np.array([0xFFF0000000000000, 0x0000000000000001], dtype=np.uint64)])
+    expected = np.zeros(1 << p, dtype=np.uint8)
+    for h in hashes.tolist():
+        rest = h & ((1 << (64 - p)) - 1)
+        rank = (64 - p) - rest.bit_length() + 1
+        expected[h >> (64 - p)] = max(expected[h >> (64 - p)], rank)
+    np.testing.assert_array_equal(approx.hll_registers(hashes), expected)
+
+
+@pytest.mark.parametrize('n', [10, 200, 5000, 100000, 1000000])
+def test_hll_estimate_within_error(n):
+    estimate, rse = approx.hll_estimate(approx.hll_registers(approx.hash64(np.arange(n) + 7)))
+    # Linear counting keeps tiny cardinalities within a couple of ids.
+    assert abs(estimate - n) <= max(2, 3 * rse * n)
+
+
+def test_hll_merge_is_union():
+    a = approx.hash64(np.arange(0, 30000))
+    b = approx.hash64(np.arange(20000, 50000))
+    merged = np.maximum(approx.hll_registers(a), approx.hll_registers(b))
+    np.testing.assert_array_equal(merged, approx.hll_registers(np.concatenate([a, b])))
+
+
+def test_distinct_users_interval_covers_exact(tmp_path):
+    ratings, movies = _population()
+    synopses = _synopses(tmp_path, ratings, movies, per_stratum=500)
+    covered = total = 0
+    for start, end in [(2000, 2004), (2001, 2002), (2003, 2003)]:
+        for genre in [approx.ALL, 'Comedy', 'Drama', 'Horror']:
+            exact = _exact(ratings, movies, start, end, genre)['userId'].nunique()
+            _, low, high = synopses.distinct_users(start, end, genre)
+            covered += low <= exact <= high
+            total += 1
+    assert covered / total >= 0.8
+
+
+# ============================================================================
+# STRATIFIED SAMPLE
+# ============================================================================
+
+def test_genre_bits():
+    bits = approx.genre_bits(
+        pd.Series(['Comedy|Drama', 'Horror', None, '(no genres listed)']), ['Comedy', 'Drama', 'Horror']
+    )
+    np.testing.assert_array_equal(bits, [0b011, 0b100, 0, 0])
+
+
+def test_census_sample_is_exact(tmp_path):
+    ratings, movies = _population()
+    synopses = _synopses(tmp_path, ratings, movies, per_stratum=10**6)
+    for start, end, genre in [(2000, 2004, approx.ALL), (2001, 2003, 'Drama'), (2004, 2004, 'Comedy')]:
+        exact = np.sort(_exact(ratings, movies, start, end, genre)['rating'].to_numpy(dtype=np.float32))
+        mean, low, high = synopses.mean_rating(start, end, genre)
+        assert mean == pytest.approx(exact.astype(np.float64).mean(), rel=1e-9)
+        assert high - low == pytest.approx(0, abs=1e-9)
+        for q in (0.5, 0.9):
+            # quantile_disc: the smallest value whose CDF reaches q.
+            expected = exact[int(np.ceil(q * len(exact))) - 1]
+            assert synopses.rating_quantile(q, start, end, genre)[0] == pytest.approx(expected)
+
+
+def test_interval_coverage(tmp_path):
+    ratings, movies = _population()
+    slices = [(2000, 2004, approx.ALL), (2001, 2003, 'Drama'), (2002, 2004, 'Comedy')]
+    exact = {}
+    for start, end, genre in slices:
+        values = np.sort(_exact(ratings, movies, start, end, genre)['rating'].to_numpy(dtype=np.float32))
+        exact[(start, end, genre)] = (
+            values.astype(np.float64).mean(),
+            values[int(np.ceil(0.5 * len(values))) - 1],
+        )
+
+    runs = 60
+    hits = {'mean': 0, 'median': 0}
+    for seed in range(runs):
+        synopses = _synopses(tmp_path, ratings, movies, per_stratum=300, seed=seed)
+        for key, (mean, median) in exact.items():
+            _, low, high = synopses.mean_rating(*key)
+            hits['mean'] += low <= mean <= high
+            _, low, high = synopses.rating_quantile(0.5, *key)
+            hits['median'] += low <= median <= high
+
+    # Nominal coverage is 95%; allow for Monte Carlo noise over 180 intervals.
+    for name, count in hits.items():
+        assert count / (runs * len(slices)) >= 0.88, name
+
+
+def test_slice_caches_are_per_instance(tmp_path):
+    ratings, movies = _population(per_year=500)
+    synopses = _synopses(tmp_path, ratings, movies, per_stratum=100)
+    first = synopses.quick_slice(2001, 2003, 'Drama')
+    assert synopses.quick_slice(2001, 2003, 'Drama') is first
+    # Dropping the synopses frees their cached masks and results too.
+    ref = weakref.ref(synopses)
+    del synopses
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,74 @@
+"""Publishing and reading back versioned artifacts."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+
+from utils import artifacts, data_store, schema
+
+
+def _tables():
+    gems = pd.DataFrame({
+        'movieId': [1, 2, 3],
+        'title': ["A (1994)", "B", "C (2001)"],
+        'genres': ['Drama', 'Comedy|Drama', 'Drama'],
+        'release_year': [1994, None, 2001],
+        'avg_rating': [4.25, 3.5, np.nan],
+        'num_ratings': [120, 80, 60],
+        'rating_std': [0.5, np.nan, 1.0],
+    })
+    return {'hidden_gems': schema.apply('hidden_gems', gems)}
+
+
+def _assets(tmp_path):
+    viz = tmp_path / 'viz'
+    (viz / 'section').mkdir(parents=True)
+    (viz / 'section' / 'chart.html').write_text("<div>chart</div>", encoding='utf-8')
+    (viz / 'section' / 'data.bin').write_bytes(b'\x00\x01raw')
+    return str(viz)
+
+
+def test_round_trip_keeps_dtypes_and_values(tmp_path):
+    root = str(tmp_path / 'root')
+    tables = _tables()
+    viz = _assets(tmp_path)
+    version = artifacts.publish(root, tables, [viz], {'hidden_gems': (100, 50)})
+
+    assert artifacts.active_version(root) == version
+    loaded, html, images, files, memory = artifacts.load_version(root, version)
+    tm.assert_frame_equal(loaded['hidden_gems'], tables['hidden_gems'])
+    # NaN stays NaN, not a null that would force a copy on read.
+    assert np.isnan(loaded['hidden_gems']['rating_std'][1])
+    assert memory == {'hidden_gems': (100, 50)}
+    chart = f"{viz}/section/chart.html".replace(os.sep, '/')
+    assert html == {chart: "<div>chart</div>"}
+    assert images == {}
+    with open(files[f"{viz}/section/data.bin".replace(os.sep, '/')], 'rb') as f:
+        assert f.read() == b'\x00\x01raw'
+
+
+def test_republishing_same_content_keeps_version(tmp_path):
+    root = str(tmp_path / 'root')
+    viz = _assets(tmp_path)
+    first = artifacts.publish(root, _tables(), [viz])
+    assert artifacts.publish(root, _tables(), [viz]) == first
+    assert os.listdir(os.path.join(root, 'versions')) == [f'{first}.json']
+
+    changed = _tables()
+    changed['hidden_gems'].loc[0, 'num_ratings'] = 121
+    assert artifacts.publish(root, changed, [viz]) != first
+
+
+def test_missing_pointer_means_nothing_published(tmp_path):
+    assert artifacts.active_version(str(tmp_path)) is None
+    (tmp_path / artifacts.POINTER).write_text("\n")
+    assert artifacts.active_version(str(tmp_path)) is None
+
+
+def test_snapshot_without_published_version(tmp_path, monkeypatch):
+    monkeypatch.setenv(data_store.ARTIFACT_ROOT_ENV, str(tmp_path))
+    snapshot = data_store.build_snapshot()
+    assert snapshot.version is None and snapshot.summary is None
+    assert "No data version published" in str(snapshot.summary_error)
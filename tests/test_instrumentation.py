@@ -0,0 +1,23 @@
+"""Diagnostics events reach a log handler."""
+
+import json
+import logging
+
+from utils import instrumentation
+
+
+def test_events_are_logged_when_enabled(monkeypatch, capsys):
+    monkeypatch.setenv(instrumentation.ENV_FLAG, "1")
+    monkeypatch.setattr(instrumentation.logger, "handlers", [])
+    monkeypatch.setattr(instrumentation.logger, "level", logging.NOTSET)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    instrumentation.begin_page("test")
+    with instrumentation.track("loader", "example") as span:
+        span.bytes = 10
+    instrumentation._local.events = None
+
+    lines = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+    assert lines == [{
+        "page": "test", "kind": "loader", "name": "example", "seconds": lines[0]["seconds"],
+        "bytes": 10, "cache": "hit", "error": False,
+    }]
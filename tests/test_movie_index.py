@@ -0,0 +1,22 @@
+"""movieId -> row lookup."""
+
+import numpy as np
+import pandas as pd
+
+from utils import movie_index
+
+
+def test_rating_rows_skips_unknown_movies():
+    movies = pd.DataFrame({'movieId': [10, 3, 7]})
+    ratings = pd.DataFrame({'movieId': [7, 99, 10, 7, 4]})
+    rows, known = movie_index.rating_rows(ratings, movies)
+    np.testing.assert_array_equal(known, [True, False, True, True, False])
+    np.testing.assert_array_equal(rows, [2, 0, 2])
+
+
+def test_rating_rows_with_larger_movie_ids_than_ratings():
+    movies = pd.DataFrame({'movieId': [500, 1]})
+    ratings = pd.DataFrame({'movieId': [1, 1]})
+    rows, known = movie_index.rating_rows(ratings, movies)
+    assert known.all()
+    np.testing.assert_array_equal(rows, [1, 1])
@@ -0,0 +1,72 @@
+"""Release-year parsing and rollups checked by hand."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import release_year, schema
+
+MISSING = schema.YEAR_MISSING
+
+
+@pytest.mark.parametrize('title, year', [
+    ("Planet Earth (2006)", 2006),
+    ("Planet Earth (2006) ", 2006),
+    ("Planet Earth ( 2006 )", 2006),
+    ("Planet Earth (2006–2007)", 2006),
+    ("Planet Earth (2006-2007)", 2006),
+    ("Planet Earth (2006-)", 2006),
+    ("City of Lost Children, The (Cité des enfants perdus, La) (1995)", 1995),
+    ("Planet Earth", MISSING),
+    ("Planet Earth (1234)", MISSING),
+    ("Planet Earth (2006) Special", MISSING),
+    ("", MISSING),
+    (None, MISSING),
+])
+def test_extract_years(title, year):
+    years = release_year.extract_years(pd.Series([title]))
+    assert years.dtype == np.int16
+    assert years[0] == year
+
+
+def _timestamp(day):
+    return int(np.datetime64(day, 's').astype(np.int64))
+
+
+def test_build_rollups():
+    movies = pd.DataFrame({
+        'movieId': [1, 2, 3, 4],
+        'title': ["A (1994)", "B (1996)", "C", "D (1994)"],
+    })
+    ratings = pd.DataFrame({
+        'movieId': [1, 1, 2, 3, 99],
+        'rating': [4.0, 2.0, 5.0, 3.0, 1.0],
+        'timestamp': [_timestamp(day) for day in
+                      ['2000-01-01', '2004-06-01', '1996-05-01', '2001-01-01', '2001-01-01']],
+    })
+    by_year, by_decade, years = release_year.build(ratings, movies)
+
+    np.testing.assert_array_equal(years, [1994, 1996, MISSING, 1994])
+
+    # Movie C has no year, movie D no ratings and movie 99 is unknown.
+    assert by_year['release_year'].tolist() == [1994, 1996]
+    assert by_year['num_movies'].tolist() == [1, 1]
+    assert by_year['num_ratings'].tolist() == [2, 1]
+    np.testing.assert_allclose(by_year['avg_rating'], [3.0, 5.0])
+    np.testing.assert_allclose(by_year['std_rating'][:1], [np.sqrt(2)])
+    # A single rating has no sample standard deviation.
+    assert np.isnan(by_year['std_rating'][1])
+    np.testing.assert_allclose(by_year['avg_movie_rating'], [3.0, 5.0])
+    # (2000 - 1994 + 2004 - 1994) / 2 and 1996 - 1996.
+    np.testing.assert_allclose(by_year['avg_rating_lag'], [8.0, 0.0])
+
+    assert by_decade['decade'].tolist() == [1990]
+    row = by_decade.iloc[0]
+    assert row['num_movies'] == 2
+    assert row['num_ratings'] == 3
+    assert row['avg_rating'] == pytest.approx(11 / 3)
+    # Ratings 4, 2, 5: sum of squares 45, so variance (45 - 121/3) / 2.
+    assert row['std_rating'] == pytest.approx(np.sqrt(7 / 3), rel=1e-6)
+    # Per-movie means 3 and 5.
+    assert row['avg_movie_rating'] == pytest.approx(4.0)
+    assert row['avg_rating_lag'] == pytest.approx(16 / 3, rel=1e-6)
@@ -0,0 +1,85 @@
+"""Table validation and compaction."""
+
+import logging
+
+import pandas as pd
+import pytest
+
+from utils import schema
+
+
+def _genre_stats():
+    return pd.DataFrame({
+        'genre': ['Drama', 'War'],
+        'avg_rating': [3.5, 3.8],
+        'num_ratings': [100, 20],
+        'std_rating': [1.0, 0.9],
+    })
+
+
+def test_apply_all_drops_invalid_optional_tables(caplog):
+    tables = {
+        'genre_stats': _genre_stats(),
+        'genre_pairs': pd.DataFrame({'genre_a': ['Drama']}),
+    }
+    with caplog.at_level(logging.WARNING, logger="movielens.schema"):
+        compact, report = schema.apply_all(tables, optional=['genre_pairs'])
+    assert list(compact) == ['genre_stats'] and list(report) == ['genre_stats']
+    assert "genre_pairs" in caplog.text
+
+
+def test_apply_all_raises_for_required_tables():
+    broken = _genre_stats().drop(columns=['num_ratings'])
+    with pytest.raises(schema.SchemaError, match="genre_stats: missing columns"):
+        schema.apply_all({'genre_stats': broken}, optional=['genre_pairs'])
+
+
+def _hidden_gems():
+    return pd.DataFrame({
+        'movieId': [1, 2],
+        'title': ["A (1994)", "B"],
+        'genres': ['Drama', 'Drama'],
+        'release_year': [1994.0, None],
+        'avg_rating': [4.25, 3.5],
+        'num_ratings': [120, 80],
+        'rating_std': [0.5, 0.7],
+        'extra': ['kept', 'as is'],
+    })
+
+
+def test_apply_compacts_dtypes():
+    gems = _hidden_gems()
+    out = schema.apply('hidden_gems', gems)
+    assert out['movieId'].dtype == 'int32'
+    assert out['title'].dtype == 'string[pyarrow]'
+    assert out['genres'].dtype == 'category'
+    assert out['release_year'].tolist() == [1994, schema.YEAR_MISSING]
+    assert out['avg_rating'].dtype == 'float32'
+    assert out['extra'].dtype == gems['extra'].dtype
+    assert schema.for_display(out)['release_year'].isna().tolist() == [False, True]
+
+
+@pytest.mark.parametrize('column, values, message', [
+    ('avg_rating', [4.0, 5.5], r"genre_stats.avg_rating: values outside \[0.0, 5.0\]"),
+    ('num_ratings', [100, -1], r"genre_stats.num_ratings: values outside \[0, None\]"),
+    ('num_ratings', [100, None], "genre_stats.num_ratings: missing values in an integer column"),
+    ('num_ratings', [100, 2**31], "genre_stats.num_ratings: values out of int32 range"),
+    ('avg_rating', [4.0, 'good'], "genre_stats.avg_rating: cannot convert to float32"),
+])
+def test_apply_rejects_bad_values(column, values, message):
+    df = _genre_stats()
+    df[column] = pd.Series(values, dtype=object)
+    with pytest.raises(schema.SchemaError, match=message):
+        schema.apply('genre_stats', df)
+
+
+def test_apply_rejects_fractional_years():
+    gems = _hidden_gems()
+    gems['release_year'] = [1994.5, None]
+    with pytest.raises(schema.SchemaError, match="hidden_gems.release_year: non-integer years"):
+        schema.apply('hidden_gems', gems)
+
+
+def test_apply_leaves_unknown_tables_alone():
+    df = pd.DataFrame({'x': [1]})
+    assert schema.apply('not_a_table', df) is df
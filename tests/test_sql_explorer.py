@@ -0,0 +1,113 @@
+"""SQL Explorer engine: read-only guard, cache keys and engine settings."""
+
+import itertools
+
+import pandas as pd
+import pytest
+
+from utils import sql_explorer
+
+_versions = itertools.count()
+
+
+def _engine():
+    summary = {'genre_stats': pd.DataFrame({
+        'genre': ['Drama', 'War', 'Horror'],
+        'avg_rating': [3.6, 3.8, 3.2],
+        'num_ratings': [300, 20, 50],
+    })}
+    return sql_explorer.build_engine(summary)
+
+
+def _run(con, sql, params=(), row_limit=100, timeout_seconds=10):
+    # A fresh data version per call keeps the result cache out of the way.
+    return sql_explorer._run_cached(
+        sql_explorer.normalize_sql(sql), sql, params, row_limit, timeout_seconds,
+        f"test-{next(_versions)}", con,
+    )
+
+
+# ============================================================================
+# NORMALIZE_SQL
+# ============================================================================
+
+@pytest.mark.parametrize('sql, key', [
+    ("SELECT  1", "SELECT 1"),
+    ("  SELECT\n\t1 ;  ", "SELECT 1"),
+    ("SELECT 1 -- note\nFROM t", "SELECT 1 FROM t"),
+    ("SELECT /* a\nb */ 1", "SELECT 1"),
+    ("SELECT 'a  b'", "SELECT 'a  b'"),
+    ("SELECT '--x', 1", "SELECT '--x', 1"),
+    ("SELECT 'it''s  ok'", "SELECT 'it''s  ok'"),
+    ('SELECT "odd  name" FROM t', 'SELECT "odd  name" FROM t'),
+    ("SELECT 1 -- it's a comment", "SELECT 1"),
+])
+def test_normalize_sql(sql, key):
+    assert sql_explorer.normalize_sql(sql) == key
+
+
+def test_whitespace_inside_strings_changes_the_key():
+    assert sql_explorer.normalize_sql("SELECT 'a b'") != sql_explorer.normalize_sql("SELECT 'a  b'")
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+def test_tables_are_listed_with_columns():
+    _, tables = _engine()
+    assert tables['genre_stats'] == [
+        ('genre', 'VARCHAR'), ('avg_rating', 'DOUBLE'), ('num_ratings', 'BIGINT'),
+    ]
+
+
+def test_query_runs_original_text_with_limit():
+    con, _ = _engine()
+    result = _run(
+        con, "SELECT genre FROM genre_stats WHERE num_ratings >= $n ORDER BY genre -- trailing",
+        params=(('n', 50),), row_limit=1,
+    )
+    assert result['df']['genre'].tolist() == ['Drama']
+    assert result['truncated']
+
+
+@pytest.mark.parametrize('sql', [
+    "DROP TABLE genre_stats",
+    "INSERT INTO genre_stats VALUES ('x', 1, 1)",
+    "CREATE TABLE t AS SELECT 1",
+    "SELECT 1; DROP TABLE genre_stats",
+    "COPY genre_stats TO '/tmp/out.csv'",
+    "SET enable_external_access=true",
+    "ATTACH '/tmp/other.db'",
+])
+def test_only_a_single_select_is_allowed(sql):
+    con, _ = _engine()
+    with pytest.raises(sql_explorer.QueryError, match="single SELECT"):
+        _run(con, sql)
+    assert con.cursor().execute("SELECT count(*) FROM genre_stats").fetchall() == [(3,)]
+
+
+@pytest.mark.parametrize('sql', [
+    "SELECT * FROM read_csv('/etc/passwd')",
+    "SELECT * FROM read_text('/etc/hostname')",
+])
+def test_no_file_access(sql):
+    con, _ = _engine()
+    with pytest.raises(sql_explorer.QueryError):
+        _run(con, sql)
+
+
+def test_timeout_interrupts_query():
+    con, _ = _engine()
+    with pytest.raises(sql_explorer.QueryError, match="timeout"):
+        _run(con, "SELECT count(*) FROM range(10000000000) a", timeout_seconds=0.2)
+
+
+def test_years_are_bucketed_in_utc():
+    con, _ = sql_explorer.build_engine(None)
+    cursor = con.cursor()
+    # 2024-01-01 02:00 UTC is still 2023 in New York.
+    assert cursor.execute(
+        "SELECT current_setting('TimeZone'), year(to_timestamp(1704074400))"
+    ).fetchall() == [('UTC', 2024)]
+    assert pd.to_datetime(1704074400, unit='s').year == 2024
@@ -0,0 +1,314 @@
+"""Approximate aggregates with error bounds for interactive slicing.
+
+Two kinds of synopses are built offline from the raw ratings and stored in
+``assets/data/summary/approx/`` (and published with the other artifacts):
+
+* HyperLogLog sketches of distinct users per (year, genre) cell. Sketches
+  merge by register-wise max, so any set of years/genres can be counted
+  without touching the ratings.
+* A stratified row sample (strata = rating year) with per-row weights, for
+  filtered means and quantiles with design-based confidence intervals. Each
+  row carries a ``genre_bits`` bitmask (bit ``i`` = ``i``-th genre name in
+  sorted order), so genre filters are a bitwise AND instead of string
+  matching.
+
+Each data snapshot loads them once, off the request path, when it is built
+(see ``utils.data_store``).
+
+Build them with::
+
+    python -m utils.approx build
+"""
+
+import argparse
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils import data_store
+
+APPROX_DIR = data_store.APPROX_DIR
+SKETCH_FILE = 'user_hll.npz'
+SAMPLE_FILE = 'rating_sample.parquet'
+HLL_PRECISION = 12
+DEFAULT_SAMPLE_PER_STRATUM = 20000
+ALL = '(all)'
+Z_95 = 1.959963984540054
+
+
+# ============================================================================
+# HYPERLOGLOG
+# ============================================================================
+
+def hash64(values):
+    """splitmix64 finalizer: well-mixed 64-bit hashes of integer ids."""
+    with np.errstate(over='ignore'):
+        x = np.asarray(values).astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+def hll_registers(hashes, p=HLL_PRECISION):
+    """Registers of a HyperLogLog sketch over precomputed 64-bit hashes."""
+    registers = np.zeros(1 << p, dtype=np.uint8)
+    if len(hashes) == 0:
+        return registers
+    index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+    rest = hashes << np.uint64(p)
+    # Rank = position of the leftmost 1-bit in the remaining 64 - p bits.
+    _, exponent = np.frexp(rest.astype(np.float64))
+    rank = np.where(rest == 0, 64 - p + 1, 65 - exponent).astype(np.uint8)
+    np.maximum.at(registers, index, rank)
+    return registers
+
+
+def hll_estimate(registers):
+    """Cardinality estimate and its relative standard error."""
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / np.sum(np.power(2.0, -registers.astype(np.float64)))
+    zeros = int(np.count_nonzero(registers == 0))
+    if raw <= 2.5 * m and zeros:
+        raw = m * np.log(m / zeros)  # linear counting for small ranges
+    return float(raw), 1.04 / np.sqrt(m)
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def _movie_genres(movies):
+    """One (movieId, genre) row per listed genre."""
+    pairs = movies[['movieId']].assign(genre=movies['genres'].fillna('').str.split('|'))
+    pairs = pairs.explode('genre')
+    return pairs[~pairs['genre'].isin(['', '(no genres listed)'])]
+
+
+def genre_bits(genres, genre_names):
+    """Bitmask per row of ``genres``: bit ``i`` is set for ``genre_names[i]``."""
+    if len(genre_names) > 31:
+        raise ValueError(f"{len(genre_names)} genres do not fit in an int32 bitmask")
+    lists = pd.Series(genres).fillna('').astype(object).str.split('|')
+    codes = pd.Index(genre_names).get_indexer(lists.explode().to_numpy())
+    rows = np.repeat(np.arange(len(lists)), lists.str.len().to_numpy())
+    bits = np.zeros(len(lists), dtype=np.int32)
+    known = codes >= 0
+    np.bitwise_or.at(bits, rows[known], np.left_shift(1, codes[known]).astype(np.int32))
+    return bits
+
+
+def build(ratings, movies, out_dir=APPROX_DIR, sample_per_stratum=DEFAULT_SAMPLE_PER_STRATUM, seed=0):
+    """Write HLL sketches and the stratified sample for ``ratings``."""
+    os.makedirs(out_dir, exist_ok=True)
+    years = pd.to_datetime(ratings['timestamp'], unit='s').dt.year.to_numpy()
+    hashes = hash64(ratings['userId'].to_numpy())
+
+    movie_genres = _movie_genres(movies)
+    genre_names = sorted(movie_genres['genre'].unique())
+    max_movie = int(max(ratings['movieId'].max(), movies['movieId'].max())) + 1
+    movie_ids = ratings['movieId'].to_numpy()
+
+    labels, sketches = [], []
+    year_values = np.unique(years)
+    genre_masks = [(ALL, None)]
+    for genre in genre_names:
+        has_genre = np.zeros(max_movie, dtype=bool)
+        has_genre[movie_genres.loc[movie_genres['genre'] == genre, 'movieId'].to_numpy()] = True
+        genre_masks.append((genre, has_genre[movie_ids]))
+    for year in year_values:
+        in_year = years == year
+        for genre, mask in genre_masks:
+            cell = in_year if mask is None else in_year & mask
+            labels.append((int(year), genre))
+            sketches.append(hll_registers(hashes[cell]))
+    np.savez_compressed(
+        os.path.join(out_dir, SKETCH_FILE),
+        years=np.array([y for y, _ in labels], dtype=np.int16),
+        genres=np.array([g for _, g in labels]),
+        registers=np.stack(sketches),
+    )
+
+    # Stratified sample: equal allocation per rating year, capped at the
+    # stratum size. Weight = stratum size / sample size.
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'userId': ratings['userId'].to_numpy(),
+        'movieId': movie_ids,
+        'rating': ratings['rating'].to_numpy(dtype=np.float32),
+        'year': years.astype(np.int16),
+    })
+    parts = []
+    for year, group in frame.groupby('year', sort=True):
+        n = min(len(group), sample_per_stratum)
+        take = group.iloc[rng.choice(len(group), size=n, replace=False)].copy()
+        take['stratum_size'] = np.int32(len(group))
+        parts.append(take)
+    sample = pd.concat(parts, ignore_index=True)
+    sample = sample.merge(movies[['movieId', 'genres']], on='movieId', how='left')
+    sample['genre_bits'] = genre_bits(sample['genres'], genre_names)
+    sample.to_parquet(os.path.join(out_dir, SAMPLE_FILE), index=False)
+    return len(labels), len(sample)
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+# Exact counterpart of the approximate slice, run on request by the SQL engine.
+EXACT_SQL = """
+SELECT count(DISTINCT r.userId) AS active_users,
+       avg(r.rating) AS avg_rating,
+       quantile_disc(r.rating, 0.5) AS median_rating,
+       quantile_disc(r.rating, 0.9) AS p90_rating
+FROM ratings r
+JOIN movies m USING (movieId)
+WHERE year(to_timestamp(r."timestamp")) BETWEEN $start_year AND $end_year
+  AND ($genre = '(all)' OR list_contains(string_split(m.genres, '|'), $genre))
+"""
+
+
+class Synopses:
+    """Loaded sketches and sample for one data version."""
+
+    def __init__(self, years, genres, registers, sample):
+        self.years = years
+        self.genres = genres
+        self.registers = registers
+        self.sample = sample
+        self.genre_names = sorted(set(genres.tolist()) - {ALL})
+        self.year_range = (int(years.min()), int(years.max()))
+
+        # Column arrays and per-stratum constants, computed once per load.
+        self._year = sample['year'].to_numpy()
+        self._rating = sample['rating'].to_numpy(dtype=np.float64)
+        self._bits = sample['genre_bits'].to_numpy()
+        strata, self._stratum = np.unique(self._year, return_inverse=True)
+        self._counts = np.bincount(self._stratum).astype(np.float64)
+        sizes = np.zeros(len(strata))
+        sizes[self._stratum] = sample['stratum_size'].to_numpy(dtype=np.float64)
+        self._fpc_scale = sizes ** 2 * (1 - self._counts / sizes) / self._counts
+        self._weight = (sizes / self._counts)[self._stratum]
+        # Per-instance caches, freed together with this data version.
+        self._domain = functools.lru_cache(maxsize=16)(self._domain_mask)
+        self.quick_slice = functools.lru_cache(maxsize=64)(self._quick_slice)
+
+    def distinct_users(self, start_year, end_year, genre=ALL):
+        """Approximate distinct users with a 95% interval: (est, low, high)."""
+        cells = (self.years >= start_year) & (self.years <= end_year) & (self.genres == genre)
+        merged = self.registers[cells].max(axis=0) if cells.any() else np.zeros(
+            self.registers.shape[1], dtype=np.uint8
+        )
+        estimate, rse = hll_estimate(merged)
+        half = Z_95 * rse * estimate
+        return estimate, max(estimate - half, 0.0), estimate + half
+
+    def _domain_mask(self, start_year, end_year, genre):
+        mask = (self._year >= start_year) & (self._year <= end_year)
+        if genre != ALL:
+            mask &= (self._bits & (1 << self.genre_names.index(genre))) != 0
+        mask.flags.writeable = False
+        return mask
+
+    def _linearized_se(self, z, in_domain, total_weight):
+        """Stratified standard error of sum(w * z) / total_weight."""
+        z = np.where(in_domain, z, 0.0)
+        sums = np.bincount(self._stratum, weights=z)
+        sumsq = np.bincount(self._stratum, weights=z * z)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = (sumsq - sums ** 2 / self._counts) / (self._counts - 1)
+        var = np.nan_to_num(np.clip(var, 0, None))  # one-row strata contribute 0
+        return float(np.sqrt((self._fpc_scale * var).sum())) / total_weight
+
+    def mean_rating(self, start_year, end_year, genre=ALL):
+        """Weighted mean rating with a 95% interval, or None if no rows match."""
+        in_domain = self._domain(start_year, end_year, genre)
+        if not in_domain.any():
+            return None
+        w, y = self._weight, self._rating
+        total = w[in_domain].sum()
+        mean = float((w * y)[in_domain].sum() / total)
+        half = Z_95 * self._linearized_se(y - mean, in_domain, total)
+        return mean, mean - half, mean + half
+
+    def rating_quantile(self, q, start_year, end_year, genre=ALL):
+        """Weighted quantile with a Woodruff 95% interval, or None."""
+        in_domain = self._domain(start_year, end_year, genre)
+        if not in_domain.any():
+            return None
+        w, y = self._weight, self._rating
+        total = w[in_domain].sum()
+        domain_y = y[in_domain]
+        order = np.argsort(domain_y, kind='stable')
+        cdf = np.cumsum(w[in_domain][order]) / total
+
+        def at(p):
+            return float(domain_y[order][min(np.searchsorted(cdf, p), len(order) - 1)])
+
+        estimate = at(q)
+        # Interval for the CDF at the estimate, mapped back through the CDF.
+        below = (y <= estimate).astype(np.float64)
+        cdf_at = float((w * below)[in_domain].sum() / total)
+        se = self._linearized_se(below - cdf_at, in_domain, total)
+        return estimate, at(max(q - Z_95 * se, 0.0)), at(min(q + Z_95 * se, 1.0))
+
+    def _quick_slice(self, start_year, end_year, genre=ALL):
+        """``(users, mean, median, p90)`` for one slice; ``quick_slice`` caches it."""
+        return (
+            self.distinct_users(start_year, end_year, genre),
+            self.mean_rating(start_year, end_year, genre),
+            self.rating_quantile(0.5, start_year, end_year, genre),
+            self.rating_quantile(0.9, start_year, end_year, genre),
+        )
+
+
+def read_synopses(sketch_path, sample_path):
+    """Load synopses written by ``build``."""
+    with np.load(sketch_path) as sketches:
+        years, genres, registers = sketches['years'], sketches['genres'], sketches['registers']
+    sample = pd.read_parquet(sample_path)
+    if 'genre_bits' not in sample:
+        # Sample written before genre_bits existed.
+        sample['genre_bits'] = genre_bits(sample['genres'], sorted(set(genres.tolist()) - {ALL}))
+    return Synopses(years, genres, registers, sample)
+
+
+def build_synopses(files):
+    """Synopses from a snapshot's ``files`` mapping, or None if not built."""
+    sketch_path = files.get(f"{APPROX_DIR}/{SKETCH_FILE}")
+    sample_path = files.get(f"{APPROX_DIR}/{SAMPLE_FILE}")
+    if sketch_path is None or sample_path is None:
+        return None
+    return read_synopses(sketch_path, sample_path)
+
+
+def load_synopses():
+    """Synopses for the current data version, or None if not built."""
+    return data_store.current().synopses
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    from utils import sql_explorer
+
+    parser = argparse.ArgumentParser(description="Build approximate-query synopses.")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--per-stratum', type=int, default=DEFAULT_SAMPLE_PER_STRATUM)
+    parser.add_argument('--out', default=APPROX_DIR)
+    args = parser.parse_args(argv)
+
+    ratings = pd.read_parquet(
+        sql_explorer.RAW_TABLES['ratings'], columns=['userId', 'movieId', 'rating', 'timestamp']
+    )
+    movies = pd.read_parquet(sql_explorer.RAW_TABLES['movies'], columns=['movieId', 'genres'])
+    cells, rows = build(ratings, movies, args.out, args.per_stratum)
+    print(f"Wrote {cells} sketches and a {rows}-row sample to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+"""Versioned, content-addressed artifact directory shared by replicas.
+
+Layout under the artifact root (typically a shared volume)::
+
+    objects/<sha256>.arrow   summary tables as uncompressed Arrow IPC files
+    objects/<sha256>         visualizations, images, source CSVs (served as
+                             downloads) and approximate-query synopses,
+                             byte-for-byte
+    versions/<version>.json  manifest mapping logical names to objects
+    CURRENT                  id of the active version
+
+Objects and manifests are immutable and written via temp file + rename, so
+publishing a new data build is just writing its objects and manifest and then
+atomically replacing ``CURRENT``. Replicas poll ``CURRENT`` and memory-map the
+tables of whichever version it names, so they all agree on what to serve.
+
+Tables are validated and compacted (``utils.schema``) once, at publish time.
+Replicas read them without conversion: numeric and string columns stay backed
+by the memory map instead of being copied to each process's heap, so replicas
+on one host share a single copy in the page cache.
+
+Publish the local assets with::
+
+    python -m utils.artifacts publish /mnt/shared/movielens
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import pyarrow as pa
+from PIL import Image
+
+POINTER = 'CURRENT'
+
+
+# ============================================================================
+# PUBLISHING
+# ============================================================================
+
+def _write_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _put_object(root, data, suffix=''):
+    """Store ``data`` under its content hash; a no-op if it already exists."""
+    digest = hashlib.sha256(data).hexdigest()
+    path = os.path.join(root, 'objects', digest + suffix)
+    if not os.path.exists(path):
+        _write_atomic(path, data)
+    return {'object': digest + suffix, 'sha256': digest, 'bytes': len(data)}
+
+
+def _table_bytes(df):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Keep NaN as NaN rather than null in float columns: pandas would have to
+    # fill nulls into a private copy when reading the table back.
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type) and table.column(i).null_count:
+            table = table.set_column(i, field, pa.array(df[field.name].to_numpy(), from_pandas=False))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def publish(root, tables, asset_dirs, memory=None):
+    """Publish ``tables`` (name -> DataFrame) and every file in ``asset_dirs``.
+
+    ``memory`` is the ``schema.apply_all`` report, stored so replicas can show
+    it without recomputing. Returns the new version id after switching
+    ``CURRENT`` to it.
+    """
+    os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+    os.makedirs(os.path.join(root, 'versions'), exist_ok=True)
+
+    manifest = {'tables': {}, 'assets': {}}
+    for name, df in sorted(tables.items()):
+        entry = _put_object(root, _table_bytes(df), '.arrow')
+        entry['rows'] = len(df)
+        if memory and name in memory:
+            entry['memory'] = list(memory[name])
+        manifest['tables'][name] = entry
+
+    for assets_dir in asset_dirs:
+        for dirpath, dirnames, filenames in os.walk(assets_dir):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                with open(path, 'rb') as f:
+                    data = f.read()
+                manifest['assets'][path.replace(os.sep, '/')] = _put_object(root, data)
+
+    body = json.dumps(manifest, sort_keys=True).encode()
+    version = hashlib.sha256(body).hexdigest()[:16]
+    manifest['version'] = version
+    manifest['published_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+    manifest_path = os.path.join(root, 'versions', f'{version}.json')
+    if not os.path.exists(manifest_path):
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    _write_atomic(os.path.join(root, POINTER), version.encode())
+    return version
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+def active_version(root):
+    """Version id named by ``CURRENT``, or None if nothing is published."""
+    try:
+        with open(os.path.join(root, POINTER), 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def load_manifest(root, version):
+    with open(os.path.join(root, 'versions', f'{version}.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_table(root, entry):
+    """Memory-map one published table and return it as a DataFrame.
+
+    Numeric and string columns are zero-copy views of the mapping; only
+    categorical codes are materialized.
+    """
+    source = pa.memory_map(os.path.join(root, 'objects', entry['object']), 'r')
+    return pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+
+
+def load_version(root, version):
+    """Return ``(tables, html, images, files, memory)`` for a published version.
+
+    ``files`` maps every asset's original path to its object file, and
+    ``memory`` is the table memory report recorded at publish time.
+    """
+    manifest = load_manifest(root, version)
+    tables = {name: read_table(root, entry) for name, entry in manifest['tables'].items()}
+    memory = {
+        name: tuple(entry['memory'])
+        for name, entry in manifest['tables'].items() if 'memory' in entry
+    }
+
+    html, images, files = {}, {}, {}
+    for path, entry in manifest['assets'].items():
+        object_path = os.path.join(root, 'objects', entry['object'])
+        files[path] = object_path
+        if path.endswith('.html'):
+            with open(object_path, 'r', encoding='utf-8') as f:
+                html[path] = f.read()
+        elif path.lower().endswith(('.png', '.jpg', '.jpeg')):
+            img = Image.open(object_path)
+            img.load()
+            images[path] = img
+    return tables, html, images, files, memory
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    from utils import data_store, schema
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    pub = sub.add_parser('publish', help='publish local assets as a new version')
+    pub.add_argument('root', help='artifact root directory')
+    show = sub.add_parser('current', help='print the active version id')
+    show.add_argument('root', help='artifact root directory')
+    args = parser.parse_args(argv)
+
+    if args.command == 'publish':
+        tables, memory = schema.apply_all(data_store.read_summary_tables(), data_store.OPTIONAL_TABLES)
+        print(publish(args.root, tables, data_store.ASSET_DIRS, memory))
+    else:
+        print(active_version(args.root) or '')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+"""Narrative HTML shared by the live pages and the static site build.
+
+Each constant is passed to ``st.markdown(..., unsafe_allow_html=True)`` by the
+Streamlit pages and embedded verbatim by ``utils.static_site``.
+"""
+
+# ============================================================================
+# MAIN DASHBOARD (app.py)
+# ============================================================================
+
+PROJECT_OVERVIEW = """
+<div style='background-color: #1a1a1a; padding: 2rem; border-radius: 8px; border: 1px solid #333;'>
+    <h3>Business Context</h3>
+    <p style='font-size: 1.1rem; line-height: 1.8;'>
+    As Data Scientists for a leading streaming platform, we analyzed <strong>33.8 million ratings</strong> 
+    from <strong>331,000 users</strong> across <strong>86,000 movies</strong> to extract actionable insights 
+    for content strategy, user engagement, and personalized recommendations.
+    </p>       
+</div>
+"""
+
+NAVIGATION = """
+<div style='background-color: #1a1a1a; padding: 2rem; border-radius: 8px; border: 1px solid #333;'>
+    <h3>Dashboard Sections</h3>
+    <ul style='font-size: 1.1rem; line-height: 2;'>
+        <li>👥 <strong>User Behavior</strong>
+            <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
+                <li>Rating patterns</li>
+                <li>Temporal trends</li>
+                <li>User retention</li>
+            </ul>
+        </li>
+        <li>🎬 <strong>Content Performance</strong>
+            <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
+                <li>Genre analysis</li>
+                <li>Tag sentiment</li>
+                <li>Release year impact</li>
+            </ul>
+        </li>
+        <li>💎 <strong>Hidden Gems</strong>
+            <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
+                <li>Underrated movies</li>
+                <li>Quality vs popularity</li>
+            </ul>
+        </li>
+        <li>🎭 <strong>User Personas</strong>
+            <ul style='font-size: 0.95rem; margin-left: 1.5rem;'>
+                <li>Genre preferences</li>
+                <li>Clustering analysis</li>
+            </ul>
+        </li>
+    </ul>
+</div>
+"""
+
+HOME_INSIGHT_USERS = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914; height: 200px;'>
+    <h3>👥 User Behavior</h3>
+    <p>• 3 distinct user segments identified</p>
+    <p>• Peak activity: 8-10 PM weekdays</p>
+    <p>• 28-year rating history analyzed</p>
+</div>
+"""
+
+HOME_INSIGHT_CONTENT = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914; min-height: 200px;'>
+    <h3>🎬 Content Insights</h3>
+    <p>• Film-Noir highest rated genre (4.0★)</p>
+    <p>• IMAX format: +1.9% rating boost</p>
+    <p>• 1940s golden age of cinema</p>
+    <p>• 194 hidden gems discovered</p>
+</div>
+"""
+
+HOME_INSIGHT_RECOMMENDATIONS = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914; height: 200px;'>
+    <h3>🎯 Recommendations</h3>
+    <p>• 5 user personas identified</p>
+    <p>• ML models: 66% Precision@10</p>
+    <p>• Personalization opportunities</p>
+</div>
+"""
+
+HOME_INSIGHTS = [HOME_INSIGHT_USERS, HOME_INSIGHT_CONTENT, HOME_INSIGHT_RECOMMENDATIONS]
+
+# ============================================================================
+# BUSINESS INSIGHTS
+# ============================================================================
+
+INTRO_USER_BEHAVIOR = """
+<div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
+    <p style='font-size: 1.05rem;'>
+    Understanding user rating patterns, temporal trends, and engagement behaviors across our platform.
+    </p>
+</div>
+"""
+
+INTRO_CONTENT_PERFORMANCE = """
+<div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
+    <p style='font-size: 1.05rem;'>
+    Analyzing genre performance, user-generated tags, and release year impact on ratings.
+    </p>
+</div>
+"""
+
+INTRO_HIDDEN_GEMS = """
+<div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
+    <p style='font-size: 1.05rem;'>
+    High-quality movies (≥4.0★) with low visibility (10-100 ratings) - perfect for curation and promotion.
+    </p>
+</div>
+"""
+
+INTRO_LEADERBOARDS = """
+<div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
+    <p style='font-size: 1.05rem;'>
+    Bayesian-weighted rankings: each movie's average is pulled toward the platform mean until it has enough ratings to stand on its own.
+    </p>
+</div>
+"""
+
+INTRO_USER_PERSONAS = """
+<div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
+    <p style='font-size: 1.05rem;'>
+    K-Means clustering analysis revealing distinct user segments based on genre preferences.
+    </p>
+</div>
+"""
+
+INTRO_EXPORT_DATA = """
+<div style='background-color: #1a1a1a; padding: 1rem; border-radius: 8px; margin-bottom: 2rem;'>
+    <p style='font-size: 1.05rem;'>
+    Download summary data and insights for further analysis or reporting.
+    </p>
+</div>
+"""
+
+INSIGHT_USER_SEGMENTS = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
+    <h4>User Segments</h4>
+    <p>• Harsh Raters: <strong>8.5%</strong></p>
+    <p>• Neutral Raters: <strong>73.2%</strong></p>
+    <p>• Generous Raters: <strong>18.3%</strong></p>
+</div>
+"""
+
+INSIGHT_PEAK_ACTIVITY = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
+    <h4>Peak Activity</h4>
+    <p>• Time: <strong>8-10 PM</strong></p>
+    <p>• Day: <strong>Weekdays</strong></p>
+    <p>• Month: <strong>October</strong></p>
+</div>
+"""
+
+INSIGHT_TRENDS = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
+    <h4>Trends</h4>
+    <p>• 28-year history</p>
+    <p>• Steady growth since 1995</p>
+    <p>• Peak: 2016-2018</p>
+</div>
+"""
+
+INSIGHT_TOP_GENRES = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
+    <h4>Top Genres</h4>
+    <p>• Film-Noir: <strong>4.00★</strong></p>
+    <p>• Documentary: <strong>3.95★</strong></p>
+    <p>• War: <strong>3.93★</strong></p>
+</div>
+"""
+
+INSIGHT_GOLDEN_ERA = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
+    <h4>Golden Era</h4>
+    <p>• Best decade: <strong>1940s</strong></p>
+    <p>• Peak rating: <strong>3.85★</strong></p>
+    <p>• Classic cinema dominance</p>
+</div>
+"""
+
+INSIGHT_TAGS = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #E50914;'>
+    <h4>Tag Insights</h4>
+    <p>• Positive tags: <strong>2.2%</strong></p>
+    <p>• Neutral tags: <strong>96.5%</strong></p>
+    <p>• Negative tags: <strong>1.3%</strong></p>
+</div>
+"""
+
+PERSONAS_LEFT = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
+    <h4>🎭 Drama Enthusiasts (27.0%)</h4>
+    <p>Prefers: Drama, Romance, Thriller</p>
+    <p>Characteristics: Emotional, character-driven stories</p>
+</div>
+
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
+    <h4>🎬 Mainstream Viewers (25.1%)</h4>
+    <p>Prefers: Comedy, Drama, Action</p>
+    <p>Characteristics: Popular, accessible content</p>
+</div>
+
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px;'>
+    <h4>🚀 Sci-Fi Fans (10.0%)</h4>
+    <p>Prefers: Sci-Fi, Action, Fantasy</p>
+    <p>Characteristics: Speculative, futuristic themes</p>
+</div>
+"""
+
+PERSONAS_RIGHT = """
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
+    <h4>🎨 Art House Lovers (28.4%)</h4>
+    <p>Prefers: Documentary, Film-Noir, Independent</p>
+    <p>Characteristics: Intellectual, artistic films</p>
+</div>
+
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;'>
+    <h4>👨‍👩‍👧‍👦 Family Oriented (9.5%)</h4>
+    <p>Prefers: Animation, Children, Comedy</p>
+    <p>Characteristics: All-ages, wholesome content</p>
+</div>
+
+<div style='background-color: #1a1a1a; padding: 1.5rem; border-radius: 8px;'>
+    <h4>💡 Strategic Value</h4>
+    <p>Enable persona-specific homepage experiences</p>
+    <p>Expected impact: 15-25% engagement increase</p>
+</div>
+"""
+
+PREMIUM_EFFECT = """
+<p>Technical format significantly influences subscriber satisfaction. IMAX-formatted movies demonstrate
+measurable performance advantages over standard releases.</p>
+<p><strong>Key Data Points:</strong></p>
+<ul>
+    <li><strong>Statistical Outperformance:</strong> IMAX-formatted movies outperform standard releases by <strong>1.9%</strong></li>
+    <li><strong>Rating Comparison:</strong> IMAX titles hold an average rating of <strong>3.607 stars</strong>, compared to <strong>3.539 stars</strong> for standard releases</li>
+    <li><strong>Statistical Significance:</strong> The difference in ratings is statistically valid, with a <strong>p-value under 0.05</strong></li>
+</ul>
+<p><strong>Strategic Recommendation:</strong></p>
+<p><strong>Content Acquisition Strategy:</strong> The platform should prioritize licensing IMAX-format releases
+when possible to maximize user satisfaction and engagement. This premium format investment directly correlates
+with improved subscriber experience.</p>
+"""
+
+USER_BEHAVIOR_INSIGHTS = [INSIGHT_USER_SEGMENTS, INSIGHT_PEAK_ACTIVITY, INSIGHT_TRENDS]
+CONTENT_INSIGHTS = [INSIGHT_TOP_GENRES, INSIGHT_GOLDEN_ERA, INSIGHT_TAGS]
+PERSONAS = [PERSONAS_LEFT, PERSONAS_RIGHT]
@@ -0,0 +1,297 @@
+"""Process-wide cache of summary data and visualization assets.
+
+``warm()`` builds a snapshot of every summary CSV, HTML visualization and
+image, plus the derived leaderboard arrays, approximate synopses and SQL
+engine, in a background thread. ``python -m utils.serve`` calls it before the
+server accepts connections, so the first visitor after a deploy does not pay
+for the build (under plain ``streamlit run`` the first script run starts it).
+A daemon thread then polls the asset directories
+and, when any file changes, builds a new snapshot off the request path and
+swaps it in with a single reference assignment. Script runs call
+``current()`` once and keep using that snapshot, so a reload never blocks a
+request or mixes two versions on one page.
+
+When ``MOVIELENS_ARTIFACT_ROOT`` points at a published artifact directory
+(see ``utils.artifacts``), snapshots are loaded from the version named by its
+``CURRENT`` pointer instead of the local ``assets/`` tree.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+from PIL import Image
+
+from utils import artifacts, instrumentation, schema
+
+SUMMARY_DIR = 'assets/data/summary'
+VIZ_DIR = 'assets/visualizations'
+APPROX_DIR = 'assets/data/summary/approx'
+# Optional raw Parquet exports behind the SQL Explorer's ratings/movies views.
+RAW_DIR = 'assets/data/raw'
+# Directories whose files are published as assets and listed in ``files``
+# (SUMMARY_DIR covers the source CSVs and APPROX_DIR).
+ASSET_DIRS = [VIZ_DIR, SUMMARY_DIR]
+SUMMARY_TABLES = [
+    'platform_stats',
+    'user_segments',
+    'yearly_trends',
+    'genre_stats',
+    'hidden_gems',
+    'top_movies',
+]
+# Derived tables that only exist once their build stage has been run.
+OPTIONAL_TABLES = [
+    'genre_pairs',
+    'release_years',
+    'release_decades',
+    'movie_stats',
+]
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+REFRESH_SECONDS_ENV = "MOVIELENS_REFRESH_SECONDS"
+ARTIFACT_ROOT_ENV = "MOVIELENS_ARTIFACT_ROOT"
+DEFAULT_REFRESH_SECONDS = 30
+
+logger = logging.getLogger("movielens.data_store")
+
+
+# ============================================================================
+# SNAPSHOTS
+# ============================================================================
+
+class Snapshot:
+    """One immutable version of everything the pages read from disk."""
+
+    def __init__(self, version, summary, summary_error, html, images, memory=None,
+                 movie_table=None, files=None, synopses=None, engine=None):
+        self.version = version
+        self.summary = summary
+        self.summary_error = summary_error
+        self.html = html
+        self.images = images
+        # Asset path -> readable file (the local file, or its published object).
+        self.files = files or {}
+        # Table name -> (bytes with default dtypes, bytes after compaction).
+        self.memory = memory or {}
+        # Leaderboard arrays (utils.leaderboard.MovieTable), or None without data.
+        self.movie_table = movie_table
+        # Approximate-query synopses (utils.approx.Synopses), or None if not built.
+        self.synopses = synopses
+        # SQL Explorer ``(connection, tables)`` (utils.sql_explorer.build_engine).
+        self.engine = engine
+
+
+def scan_version():
+    """Fingerprint of every watched file's path, size and mtime.
+
+    With an artifact root this is the published version id instead (raw
+    Parquet files added later show up with the next published version).
+    """
+    root = os.environ.get(ARTIFACT_ROOT_ENV)
+    if root:
+        return artifacts.active_version(root)
+    digest = hashlib.sha1()
+    for directory in (SUMMARY_DIR, VIZ_DIR, RAW_DIR):
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:12]
+
+
+def read_summary_tables():
+    """Read every summary CSV (and any optional ones present) into DataFrames."""
+    tables = {
+        name: pd.read_csv(os.path.join(SUMMARY_DIR, f"{name}.csv"))
+        for name in SUMMARY_TABLES
+    }
+    for name in OPTIONAL_TABLES:
+        path = os.path.join(SUMMARY_DIR, f"{name}.csv")
+        if os.path.exists(path):
+            try:
+                tables[name] = pd.read_csv(path)
+            except Exception as e:
+                # A broken derived table must not take the required ones down.
+                logger.warning("Skipping optional table %s: %s", name, e)
+    return tables
+
+
+def source_csv(snapshot, name):
+    """Original bytes of summary table ``name``'s CSV, for downloads.
+
+    The in-memory tables are compacted (float32 and friends), so writing them
+    back out would not reproduce the source values.
+    """
+    path = snapshot.files.get(f"{SUMMARY_DIR}/{name}.csv")
+    if path is None:
+        # Published before the source CSVs were: closest we can get.
+        return schema.for_display(snapshot.summary[name]).to_csv(index=False).encode()
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _movie_table(summary):
+    # Imported here because utils.leaderboard reads snapshots from this module.
+    from utils import leaderboard
+    return leaderboard.build_movie_table(summary)
+
+
+def _synopses(files):
+    from utils import approx
+    try:
+        return approx.build_synopses(files)
+    except Exception as e:
+        logger.warning("Skipping approximate synopses: %s", e)
+        return None
+
+
+def _engine(summary):
+    from utils import sql_explorer
+    try:
+        return sql_explorer.build_engine(summary)
+    except Exception as e:
+        logger.warning("SQL engine not prepared: %s", e)
+        return None
+
+
+def build_snapshot(version=None):
+    """Read and derive everything for one snapshot."""
+    version = version or scan_version()
+
+    root = os.environ.get(ARTIFACT_ROOT_ENV)
+    if root:
+        try:
+            if version is None:
+                raise FileNotFoundError(f"No data version published under {root} (no {artifacts.POINTER} file)")
+            # Published tables were validated and compacted at publish time.
+            summary, html, images, files, memory = artifacts.load_version(root, version)
+            return Snapshot(
+                version, summary, None, html, images, memory, _movie_table(summary), files,
+                _synopses(files), _engine(summary),
+            )
+        except Exception as e:
+            return Snapshot(version, None, e, {}, {})
+
+    try:
+        summary, memory = schema.apply_all(read_summary_tables(), OPTIONAL_TABLES)
+        movie_table = _movie_table(summary)
+        summary_error = None
+    except Exception as e:
+        summary, summary_error, memory, movie_table = None, e, {}, None
+
+    html, images, files = {}, {}, {}
+    for directory in ASSET_DIRS:
+        for dirpath, _, filenames in os.walk(directory):
+            for name in filenames:
+                path = os.path.join(dirpath, name).replace(os.sep, '/')
+                files[path] = path
+                try:
+                    if name.endswith('.html'):
+                        with open(path, 'r', encoding='utf-8') as f:
+                            html[path] = f.read()
+                    elif name.lower().endswith(IMAGE_EXTENSIONS):
+                        img = Image.open(path)
+                        img.load()
+                        images[path] = img
+                except Exception as e:
+                    logger.warning("Skipping asset %s: %s", path, e)
+
+    return Snapshot(
+        version, summary, summary_error, html, images, memory, movie_table, files,
+        _synopses(files), _engine(summary),
+    )
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class DataStore:
+    """Holds the current snapshot and refreshes it in the background."""
+
+    def __init__(self, refresh_seconds):
+        self._snapshot = build_snapshot()
+        self._refresh_seconds = refresh_seconds
+        self._stop = threading.Event()
+        self._thread = None
+        if refresh_seconds > 0:
+            self._thread = threading.Thread(
+                target=self._watch, name="movielens-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def current(self):
+        return self._snapshot
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self):
+        """Rebuild if any watched file changed; returns True when swapped."""
+        version = scan_version()
+        if version == self._snapshot.version:
+            return False
+        start = time.perf_counter()
+        snapshot = build_snapshot(version)
+        if snapshot.summary is None and self._snapshot.summary is not None:
+            # Half-written files: keep serving the previous version.
+            logger.warning("Refresh to %s failed: %s", version, snapshot.summary_error)
+            return False
+        self._snapshot = snapshot
+        logger.info(
+            "Swapped in data version %s (%.0f ms)", version, (time.perf_counter() - start) * 1000
+        )
+        return True
+
+    def _watch(self):
+        while not self._stop.wait(self._refresh_seconds):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Background refresh failed")
+
+
+_store = None
+_warm_thread = None
+_warm_lock = threading.Lock()
+
+
+def _build_store():
+    global _store
+    refresh_seconds = float(os.environ.get(REFRESH_SECONDS_ENV, DEFAULT_REFRESH_SECONDS))
+    _store = DataStore(refresh_seconds)
+
+
+def warm():
+    """Start building the process-wide store in the background (idempotent)."""
+    global _warm_thread
+    with _warm_lock:
+        if _warm_thread is None:
+            _warm_thread = threading.Thread(target=_build_store, name="movielens-warm", daemon=True)
+            _warm_thread.start()
+    return _warm_thread
+
+
+def get_store():
+    """Process-wide store; only waits if the warm-up has not finished yet."""
+    if _store is None:
+        instrumentation.mark_miss()
+        warm().join()
+        if _store is None:
+            # The warm-up thread failed; build here so the error surfaces.
+            _build_store()
+    return _store
+
+
+def current():
+    """Snapshot to use for the whole of this script run."""
+    with instrumentation.track("loader", "data_store"):
+        return get_store().current()
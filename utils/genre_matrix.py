@@ -0,0 +1,122 @@
+"""Genre co-occurrence and genre-affinity matrices.
+
+Built once from the raw ratings with sparse matrix products, then stored as
+the small ``genre_pairs`` summary table for instant heatmaps:
+
+* ``G`` (movies x genres) is the 0/1 genre membership matrix.
+* ``G.T @ G`` counts movies tagged with both genres.
+* ``G.T @ diag(s) @ G / G.T @ diag(n) @ G`` is the average rating of
+  movies carrying both genres, from per-movie rating sums ``s`` and counts
+  ``n`` (one ``bincount`` pass over the ratings).
+* ``U = R @ G`` with ``R`` the (users x movies) rating matrix gives each
+  user's rating-weighted genre profile; the cosine similarity of the
+  columns of ``U`` measures how much the audiences of two genres overlap.
+
+Build it with::
+
+    python -m utils.genre_matrix build
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+from scipy import sparse
+
+from utils import data_store, movie_index
+
+OUTPUT_FILE = os.path.join(data_store.SUMMARY_DIR, 'genre_pairs.csv')
+NO_GENRE = '(no genres listed)'
+
+
+def movie_genre_matrix(movies):
+    """Return ``(G, genre_names)`` with one row per row of ``movies``."""
+    genres = movies['genres'].fillna('').str.split('|').explode()
+    genres = genres[(genres != '') & (genres != NO_GENRE)]
+    codes, names = pd.factorize(genres, sort=True)
+    rows = movies.index.get_indexer(genres.index)
+    G = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.float64), (rows, codes)),
+        shape=(len(movies), len(names)),
+    )
+    return G, list(names)
+
+
+def build(ratings, movies):
+    """Compute every pairwise genre statistic in one pass over ``ratings``."""
+    movies = movies.reset_index(drop=True)
+    G, names = movie_genre_matrix(movies)
+
+    # Map ratings onto movie rows and dense user ids without Python loops.
+    movie_rows, known = movie_index.rating_rows(ratings, movies)
+    values = ratings['rating'].to_numpy(dtype=np.float64)[known]
+    user_rows, _ = pd.factorize(ratings['userId'].to_numpy()[known])
+
+    sums = np.bincount(movie_rows, weights=values, minlength=len(movies))
+    counts = np.bincount(movie_rows, minlength=len(movies)).astype(np.float64)
+
+    cooccurrence = (G.T @ G).toarray()
+    rating_sum = (G.T @ sparse.diags(sums) @ G).toarray()
+    rating_count = (G.T @ sparse.diags(counts) @ G).toarray()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_rating = rating_sum / rating_count
+
+    R = sparse.csr_matrix(
+        (values, (user_rows, movie_rows)), shape=(user_rows.max() + 1, len(movies))
+    )
+    U = R @ G
+    gram = (U.T @ U).toarray()
+    norms = np.sqrt(np.diag(gram))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        affinity = gram / np.outer(norms, norms)
+
+    a, b = np.triu_indices(len(names))
+    return pd.DataFrame({
+        'genre_a': np.asarray(names)[a],
+        'genre_b': np.asarray(names)[b],
+        'num_movies': cooccurrence[a, b].astype(np.int64),
+        'num_ratings': rating_count[a, b].astype(np.int64),
+        'avg_rating': avg_rating[a, b],
+        'user_affinity': affinity[a, b],
+    })
+
+
+def pivot(genre_pairs, value):
+    """Symmetric genre x genre matrix of ``value`` from the long table."""
+    upper = genre_pairs.pivot(index='genre_a', columns='genre_b', values=value)
+    names = sorted(set(upper.index) | set(upper.columns))
+    upper = upper.reindex(index=names, columns=names)
+    return upper.combine_first(upper.T)
+
+
+def heatmap(genre_pairs, value, label, title):
+    """Dark-themed plotly heatmap of one pairwise statistic."""
+    fig = px.imshow(
+        pivot(genre_pairs, value),
+        color_continuous_scale=['#141414', '#E50914', '#FFFFFF'],
+        labels={'color': label},
+        title=title
+    )
+    fig.update_layout(template='plotly_dark', height=600)
+    return fig
+
+
+def main(argv=None):
+    from utils import sql_explorer
+
+    parser = argparse.ArgumentParser(description="Build genre co-occurrence and affinity.")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--out', default=OUTPUT_FILE)
+    args = parser.parse_args(argv)
+
+    ratings = pd.read_parquet(sql_explorer.RAW_TABLES['ratings'], columns=['userId', 'movieId', 'rating'])
+    movies = pd.read_parquet(sql_explorer.RAW_TABLES['movies'], columns=['movieId', 'genres'])
+    pairs = build(ratings, movies)
+    pairs.to_csv(args.out, index=False)
+    print(f"Wrote {len(pairs)} genre pairs to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""Opt-in render and data-load instrumentation.
+
+Records wall time, payload bytes and cache hit/miss for every loader and
+section render. Enable with ``MOVIELENS_DIAGNOSTICS=1`` or by opening a page
+with ``?diagnostics=1``; when disabled every hook is a no-op.
+
+Each event is also logged as one JSON line at INFO on the
+``movielens.instrumentation`` logger. Unless logging is already configured
+with a handler, enabling diagnostics attaches one that writes the lines to
+stderr.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import streamlit as st
+
+ENV_FLAG = "MOVIELENS_DIAGNOSTICS"
+METRICS_FILE_ENV = "MOVIELENS_METRICS_FILE"
+
+logger = logging.getLogger("movielens.instrumentation")
+
+# Each Streamlit script run executes on its own thread, so per-run state is
+# thread-local. Process-wide totals feed the Prometheus exposition.
+_local = threading.local()
+_totals_lock = threading.Lock()
+_totals = {}
+_handler_lock = threading.Lock()
+
+
+# ============================================================================
+# SPANS
+# ============================================================================
+
+class _NullSpan:
+    """Returned when instrumentation is off; does nothing and is falsy."""
+
+    bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __bool__(self):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Times one loader call or section render."""
+
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self.bytes = 0
+        self._outer_miss = None
+
+    def __enter__(self):
+        self._outer_miss = getattr(_local, "miss", None)
+        _local.miss = False
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        inner_miss = _local.miss
+        # A miss inside a nested span is also a miss for the enclosing one.
+        _local.miss = None if self._outer_miss is None else (self._outer_miss or inner_miss)
+        if self.kind == "loader":
+            cache = "miss" if inner_miss else "hit"
+        else:
+            cache = "n/a"
+        _record(self.kind, self.name, elapsed, self.bytes, cache, exc_type is not None)
+        return False
+
+    def __bool__(self):
+        return True
+
+
+def track(kind, name):
+    """Return a context manager timing ``name``; a shared no-op when disabled."""
+    if getattr(_local, "events", None) is None:
+        return _NULL_SPAN
+    return _Span(kind, name)
+
+
+def mark_miss():
+    """Call inside a cached function body: it only runs on a cache miss."""
+    if getattr(_local, "miss", None) is not None:
+        _local.miss = True
+
+
+def render_html(html_content, height, name=None, scrolling=False):
+    """Send component HTML to the browser, recording its size."""
+    with track("component", name or "html") as span:
+        if span:
+            span.bytes = len(html_content.encode("utf-8"))
+        st.components.v1.html(html_content, height=height, scrolling=scrolling)
+
+
+# ============================================================================
+# RUN LIFECYCLE
+# ============================================================================
+
+def is_enabled():
+    if os.environ.get(ENV_FLAG, "").lower() in ("1", "true", "yes"):
+        return True
+    try:
+        return st.query_params.get("diagnostics") == "1"
+    except Exception:
+        return False
+
+
+def _enable_logging():
+    # Python drops INFO records when no handler is configured anywhere.
+    with _handler_lock:
+        logger.setLevel(logging.INFO)
+        if not logger.hasHandlers():
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+
+
+def begin_page(page):
+    """Start collecting events for this script run of ``page``."""
+    if is_enabled():
+        _enable_logging()
+        _local.events = []
+        _local.page = page
+        _local.page_start = time.perf_counter()
+    else:
+        _local.events = None
+
+
+def end_page():
+    """Record the full page render and draw the sidebar diagnostics panel."""
+    events = getattr(_local, "events", None)
+    if events is None:
+        return
+    _record("page", _local.page, time.perf_counter() - _local.page_start, 0, "n/a", False)
+    _local.events = None
+
+    path = os.environ.get(METRICS_FILE_ENV)
+    if path:
+        _write_atomic(path, prometheus_text())
+
+    with st.sidebar.expander("⏱️ Diagnostics", expanded=False):
+        st.dataframe(
+            [
+                {
+                    "kind": e["kind"],
+                    "name": e["name"],
+                    "ms": round(e["seconds"] * 1000, 2),
+                    "KB": round(e["bytes"] / 1024, 1),
+                    "cache": e["cache"],
+                }
+                for e in events
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.download_button(
+            label="Prometheus metrics",
+            data=prometheus_text(),
+            file_name="movielens_metrics.prom",
+            mime="text/plain",
+        )
+
+
+def _record(kind, name, seconds, nbytes, cache, error):
+    event = {
+        "page": getattr(_local, "page", None),
+        "kind": kind,
+        "name": name,
+        "seconds": seconds,
+        "bytes": nbytes,
+        "cache": cache,
+        "error": error,
+    }
+    events = getattr(_local, "events", None)
+    if events is not None:
+        events.append(event)
+    logger.info(json.dumps(event))
+
+    key = (kind, name, cache)
+    with _totals_lock:
+        count, total_seconds, total_bytes = _totals.get(key, (0, 0.0, 0))
+        _totals[key] = (count + 1, total_seconds + seconds, total_bytes + nbytes)
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def prometheus_text():
+    """Cumulative process-wide metrics in the Prometheus text format."""
+    with _totals_lock:
+        items = sorted(_totals.items())
+    lines = [
+        "# HELP movielens_render_seconds_total Wall time spent per loader or section.",
+        "# TYPE movielens_render_seconds_total counter",
+    ]
+    for (kind, name, cache), (_, seconds, _) in items:
+        lines.append(f'movielens_render_seconds_total{{kind="{kind}",name="{name}",cache="{cache}"}} {seconds:.6f}')
+    lines += [
+        "# HELP movielens_render_calls_total Number of loader calls or section renders.",
+        "# TYPE movielens_render_calls_total counter",
+    ]
+    for (kind, name, cache), (count, _, _) in items:
+        lines.append(f'movielens_render_calls_total{{kind="{kind}",name="{name}",cache="{cache}"}} {count}')
+    lines += [
+        "# HELP movielens_render_bytes_total Payload bytes loaded or sent to the browser.",
+        "# TYPE movielens_render_bytes_total counter",
+    ]
+    for (kind, name, cache), (_, _, nbytes) in items:
+        lines.append(f'movielens_render_bytes_total{{kind="{kind}",name="{name}",cache="{cache}"}} {nbytes}')
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
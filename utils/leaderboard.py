@@ -0,0 +1,176 @@
+"""Parameterized movie leaderboards with Bayesian (IMDb-style) ranking.
+
+Per-movie aggregates come from the optional ``movie_stats`` summary table,
+built from the raw ratings exported to ``assets/data/raw`` with::
+
+    python -m utils.leaderboard build
+
+Without it, the movies already present in ``top_movies`` and ``hidden_gems``
+are used. The ``MovieTable`` is built with each data snapshot, in the
+background, and holds flat arrays so every filter is a vectorized mask; top-K
+uses ``np.argpartition`` instead of sorting the whole catalog.
+
+The weighted score of a movie with ``v`` ratings averaging ``R`` is::
+
+    (v / (v + m)) * R + (m / (v + m)) * C
+
+where ``m`` is the prior weight (in ratings) and ``C`` the prior mean.
+"""
+
+import argparse
+import os
+
+import duckdb
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import data_store, release_year, schema, sql_explorer
+
+OUTPUT_FILE = os.path.join(data_store.SUMMARY_DIR, 'movie_stats.csv')
+ANY = 'Any'
+DEFAULT_PRIOR_WEIGHT = 500
+# Popularity bands used for ``content_type`` in top_movies.csv.
+CONTENT_TYPE_BINS = [0, 100, 1000, np.inf]
+CONTENT_TYPES = ['Niche', 'Mid-tier', 'Mainstream']
+
+
+# ============================================================================
+# PER-MOVIE AGGREGATES
+# ============================================================================
+
+def aggregates_from_raw():
+    """Per-movie rating aggregates from the raw Parquet exports."""
+    ratings = os.path.abspath(sql_explorer.RAW_TABLES['ratings'])
+    movies = os.path.abspath(sql_explorer.RAW_TABLES['movies'])
+    return duckdb.sql(f"""
+        SELECT m.movieId, m.title, m.genres,
+               a.avg_rating, a.num_ratings, a.rating_std
+        FROM (
+            SELECT movieId, avg(rating) AS avg_rating,
+                   count(*) AS num_ratings, stddev_samp(rating) AS rating_std
+            FROM read_parquet('{ratings}')
+            GROUP BY movieId
+        ) a
+        JOIN read_parquet('{movies}') m USING (movieId)
+    """).df()
+
+
+def _aggregates_from_summary(summary):
+    columns = ['movieId', 'title', 'genres', 'avg_rating', 'num_ratings', 'rating_std']
+    movies = pd.concat(
+        [summary['top_movies'][columns], summary['hidden_gems'][columns]], ignore_index=True
+    )
+    return movies.drop_duplicates('movieId')
+
+
+class MovieTable:
+    """Column arrays for every movie, plus genre membership masks."""
+
+    def __init__(self, movies, prior_mean):
+        self.prior_mean = prior_mean
+        self.movie_id = movies['movieId'].to_numpy()
+        self.title = movies['title'].astype('string[pyarrow]').array
+        # Genre strings repeat heavily: keep per-row codes into the distinct
+        # combinations, and genre membership per combination.
+        genres = movies['genres'].astype('category')
+        self.genre_codes = genres.cat.codes.to_numpy()
+        self.genre_categories = genres.cat.categories
+        self.mean = movies['avg_rating'].to_numpy(dtype=np.float32)
+        self.count = movies['num_ratings'].to_numpy(dtype=np.int32)
+        self.year = release_year.extract_years(movies['title'])
+        self.content_type = pd.cut(
+            self.count, CONTENT_TYPE_BINS, right=False, labels=CONTENT_TYPES
+        ).codes.astype(np.int8)
+
+        category_lists = pd.Series(self.genre_categories.astype(object)).str.split('|')
+        self.genre_names = sorted(
+            {g for gs in category_lists for g in gs} - {'', '(no genres listed)'}
+        )
+        # One entry per combination plus a trailing False for code -1 (missing).
+        self.genre_membership = {
+            genre: np.array([genre in gs for gs in category_lists] + [False])
+            for genre in self.genre_names
+        }
+        decades = self.year[self.year != schema.YEAR_MISSING] // 10 * 10
+        self.decades = sorted(set(decades.tolist()))
+
+    def __len__(self):
+        return len(self.movie_id)
+
+    def top_k(self, k=20, genre=ANY, decade=ANY, content_type=ANY,
+              min_ratings=0, prior_weight=DEFAULT_PRIOR_WEIGHT, prior_mean=None):
+        """Top ``k`` movies by Bayesian-weighted score among those matching."""
+        mask = self.count >= min_ratings
+        if genre != ANY:
+            mask &= self.genre_membership[genre][self.genre_codes]
+        if decade != ANY:
+            mask &= (self.year // 10 * 10) == int(decade)
+        if content_type != ANY:
+            mask &= self.content_type == CONTENT_TYPES.index(content_type)
+        candidates = np.flatnonzero(mask)
+
+        c = self.prior_mean if prior_mean is None else prior_mean
+        v = self.count[candidates].astype(np.float64)
+        scores = (v * self.mean[candidates] + prior_weight * c) / (v + prior_weight)
+
+        if len(candidates) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+        else:
+            part = np.arange(len(candidates))
+        order = part[np.lexsort((-v[part], -scores[part]))]
+        rows = candidates[order]
+        return schema.for_display(pd.DataFrame({
+            'title': self.title[rows],
+            'genres': pd.Categorical.from_codes(
+                self.genre_codes[rows], self.genre_categories
+            ).remove_unused_categories(),
+            'release_year': self.year[rows],
+            'content_type': np.asarray(CONTENT_TYPES, dtype=object)[self.content_type[rows]],
+            'avg_rating': self.mean[rows].round(3),
+            'num_ratings': self.count[rows],
+            'weighted_score': scores[order].round(3),
+        }))
+
+
+def build_movie_table(summary):
+    """Per-movie arrays from ``movie_stats``, else the summaries, else None."""
+    if summary is None:
+        return None
+    if 'movie_stats' in summary:
+        movies = summary['movie_stats']
+    else:
+        movies = schema.apply('movie_stats', _aggregates_from_summary(summary))
+    prior_mean = float(summary['platform_stats']['avg_rating'].iloc[0])
+    return MovieTable(movies.reset_index(drop=True), prior_mean)
+
+
+def load_movie_table():
+    """Return ``(table, data_version)``; ``table`` is None without data."""
+    snapshot = data_store.current()
+    return snapshot.movie_table, snapshot.version
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def leaderboard(data_version, _table, k, genre, decade, content_type, min_ratings, prior_weight, prior_mean):
+    """Cached ``top_k`` result for one parameter set and data version."""
+    return _table.top_k(k, genre, decade, content_type, min_ratings, prior_weight, prior_mean)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build per-movie aggregates for the leaderboards.")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--out', default=OUTPUT_FILE)
+    args = parser.parse_args(argv)
+
+    movies = aggregates_from_raw()
+    movies.to_csv(args.out, index=False)
+    print(f"Wrote {len(movies)} movies to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+"""movieId -> row lookups shared by the offline builds over the raw ratings."""
+
+import numpy as np
+
+
+def rating_rows(ratings, movies):
+    """Return ``(rows, known)``: the ``movies`` row of each known rating.
+
+    ``known`` flags the ratings whose ``movieId`` appears in ``movies`` and
+    ``rows`` holds their positional row, so per-movie sums are one
+    ``bincount`` over ``rows``. ``movies`` must have a default index.
+    """
+    lookup = np.full(int(max(movies['movieId'].max(), ratings['movieId'].max())) + 1, -1)
+    lookup[movies['movieId'].to_numpy()] = np.arange(len(movies))
+    rows = lookup[ratings['movieId'].to_numpy()]
+    known = rows >= 0
+    return rows[known], known
@@ -0,0 +1,163 @@
+"""Release-year impact: title-year extraction and year/decade rollups.
+
+MovieLens stores the release year only inside the title, e.g.
+``"Planet Earth (2006)"``. ``extract_years`` parses every title with one
+vectorized regex pass and tolerates the odd formats in the catalog:
+
+* trailing or inner whitespace: ``"Title (2006) "``, ``"Title ( 2006 )"``
+* year ranges for series: ``"Title (2006–2007)"``, ``"Title (2006-)"``
+  (the first year is used)
+* no year at all, or an implausible one -> ``schema.YEAR_MISSING``
+
+``build`` joins the years to per-movie aggregates (one ``bincount`` pass over
+the ratings) and rolls them up by release year and by decade: movies, ratings,
+rating-weighted mean and standard deviation, unweighted per-movie mean, and the
+average lag between release and rating year. The rollups are stored as the
+small ``release_years`` and ``release_decades`` summary tables.
+
+Build them with::
+
+    python -m utils.release_year build
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from utils import data_store, movie_index, schema
+
+YEAR_FILE = os.path.join(data_store.SUMMARY_DIR, 'release_years.csv')
+DECADE_FILE = os.path.join(data_store.SUMMARY_DIR, 'release_decades.csv')
+# "(2006)", "( 2006 )", "(2006-2007)", "(2006–2007)", "(2006-)" at the end of the title.
+YEAR_PATTERN = r'\(\s*(\d{4})\s*(?:[-–—]\s*(?:\d{4})?\s*)?\)\s*$'
+FIRST_YEAR = 1870
+LAST_YEAR = 2100
+
+
+def extract_years(titles):
+    """Release year of each title as ``int16``, ``YEAR_MISSING`` if unknown."""
+    years = pd.Series(titles, dtype=object).fillna('').str.extract(YEAR_PATTERN, expand=False)
+    years = pd.to_numeric(years, errors='coerce')
+    years = years.where((years >= FIRST_YEAR) & (years <= LAST_YEAR))
+    return years.fillna(schema.YEAR_MISSING).to_numpy(dtype=np.int16)
+
+
+def _rollup(keys, n, sums, sumsq, lag_sums):
+    """Aggregate per-movie sums into one row per distinct ``keys`` value."""
+    rated = (keys != schema.YEAR_MISSING) & (n > 0)
+    labels, groups = np.unique(keys[rated], return_inverse=True)
+    n, sums, sumsq, lag_sums = n[rated], sums[rated], sumsq[rated], lag_sums[rated]
+
+    num_ratings = np.bincount(groups, weights=n)
+    rating_sum = np.bincount(groups, weights=sums)
+    rating_sumsq = np.bincount(groups, weights=sumsq)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = (rating_sumsq - rating_sum ** 2 / num_ratings) / (num_ratings - 1)
+    return pd.DataFrame({
+        'num_movies': np.bincount(groups).astype(np.int32),
+        'num_ratings': num_ratings.astype(np.int64),
+        'avg_rating': (rating_sum / num_ratings).astype(np.float32),
+        'std_rating': np.sqrt(np.clip(variance, 0, None)).astype(np.float32),
+        'avg_movie_rating': (np.bincount(groups, weights=sums / n) / np.bincount(groups)).astype(np.float32),
+        'avg_rating_lag': (np.bincount(groups, weights=lag_sums) / num_ratings).astype(np.float32),
+    }, index=pd.Index(labels.astype(np.int16)))
+
+
+def build(ratings, movies):
+    """Return ``(release_years, release_decades, years)``.
+
+    ``years`` is the ``extract_years`` result, one entry per row of ``movies``.
+    ``ratings`` needs ``movieId``, ``rating`` and ``timestamp`` (Unix
+    seconds); ``movies`` needs ``movieId`` and ``title``.
+    """
+    movies = movies.reset_index(drop=True)
+    years = extract_years(movies['title'])
+
+    movie_rows, known = movie_index.rating_rows(ratings, movies)
+    values = ratings['rating'].to_numpy(dtype=np.float64)[known]
+    rated_year = (
+        ratings['timestamp'].to_numpy()[known].astype('datetime64[s]').astype('datetime64[Y]').astype(np.int64)
+        + 1970
+    )
+
+    n = np.bincount(movie_rows, minlength=len(movies)).astype(np.float64)
+    sums = np.bincount(movie_rows, weights=values, minlength=len(movies))
+    sumsq = np.bincount(movie_rows, weights=values ** 2, minlength=len(movies))
+    # Sum over a movie's ratings of (rating year - release year).
+    lag_sums = np.bincount(movie_rows, weights=rated_year, minlength=len(movies)) - n * years
+
+    decades = np.where(years == schema.YEAR_MISSING, years, years // 10 * 10).astype(np.int16)
+    by_year = _rollup(years, n, sums, sumsq, lag_sums).rename_axis('release_year').reset_index()
+    by_decade = _rollup(decades, n, sums, sumsq, lag_sums).rename_axis('decade').reset_index()
+    return by_year, by_decade, years
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def best_period(stats, min_ratings=0):
+    """Row of ``stats`` with the highest average rating, or None."""
+    eligible = stats[stats['num_ratings'] >= min_ratings]
+    if eligible.empty:
+        return None
+    return eligible.loc[eligible['avg_rating'].idxmax()]
+
+
+def figure(stats, column, title):
+    """Dark-themed rating, volume and rating-lag panels over ``column``."""
+    x = stats[column]
+    fig = make_subplots(
+        rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.06,
+        subplot_titles=("Average Rating", "Number of Ratings", "Years Between Release and Rating")
+    )
+    fig.add_trace(go.Scatter(
+        x=x, y=stats['avg_rating'], name="Avg rating (all ratings)", mode='lines+markers',
+        line=dict(color='#E50914'),
+        customdata=np.stack([stats['std_rating'], stats['num_movies']], axis=-1),
+        hovertemplate="%{x}: %{y:.3f}★ (std %{customdata[0]:.2f}, %{customdata[1]} movies)<extra></extra>",
+    ), row=1, col=1)
+    fig.add_trace(go.Scatter(
+        x=x, y=stats['avg_movie_rating'], name="Avg rating (per movie)", mode='lines',
+        line=dict(color='#FFFFFF', dash='dot'),
+    ), row=1, col=1)
+    fig.add_trace(go.Bar(
+        x=x, y=stats['num_ratings'], name="Ratings", marker_color='#B20710',
+    ), row=2, col=1)
+    fig.add_trace(go.Scatter(
+        x=x, y=stats['avg_rating_lag'], name="Avg rating lag (years)", mode='lines+markers',
+        line=dict(color='#F5F5F1'),
+    ), row=3, col=1)
+    fig.update_layout(template='plotly_dark', height=900, title=title, legend=dict(orientation='h', y=-0.08))
+    return fig
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    from utils import sql_explorer
+
+    parser = argparse.ArgumentParser(description="Build release-year and decade rollups.")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--years-out', default=YEAR_FILE)
+    parser.add_argument('--decades-out', default=DECADE_FILE)
+    args = parser.parse_args(argv)
+
+    ratings = pd.read_parquet(sql_explorer.RAW_TABLES['ratings'], columns=['movieId', 'rating', 'timestamp'])
+    movies = pd.read_parquet(sql_explorer.RAW_TABLES['movies'], columns=['movieId', 'title'])
+    by_year, by_decade, years = build(ratings, movies)
+    by_year.to_csv(args.years_out, index=False)
+    by_decade.to_csv(args.decades_out, index=False)
+    missing = int((years == schema.YEAR_MISSING).sum())
+    print(f"Parsed release years for {len(years) - missing} of {len(years)} titles")
+    print(f"Wrote {len(by_year)} years to {args.years_out} and {len(by_decade)} decades to {args.decades_out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""Compact, validated in-memory dtypes for summary and per-movie tables.
+
+Every table read by the dashboard goes through ``apply`` which checks the
+expected columns and value ranges and converts them to compact dtypes:
+
+* repeated strings (``genres``, ``content_type``, ...) -> ``category``
+* unique strings (``title``) -> Arrow-backed ``string``
+* ``release_year`` -> ``int16`` with ``YEAR_MISSING`` as the missing sentinel
+* ratings and other real values -> ``float32``
+* counts and ids -> ``int32``
+
+Call ``for_display`` before rendering or exporting a table so the year
+sentinel shows as blank rather than ``-1``.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+YEAR_MISSING = -1
+
+RATING = ('float32', (0.0, 5.0))
+COUNT = ('int32', (0, None))
+REAL = ('float32', None)
+YEAR = ('year', (1800, 2100))
+CATEGORY = ('category', None)
+STRING = ('string', None)
+
+logger = logging.getLogger("movielens.schema")
+
+SCHEMAS = {
+    'platform_stats': {
+        'total_ratings': COUNT,
+        'total_users': COUNT,
+        'total_movies': COUNT,
+        'avg_rating': RATING,
+        'median_rating': RATING,
+        'dataset_size': STRING,
+    },
+    'user_segments': {
+        'segment': CATEGORY,
+        'count': COUNT,
+        'percentage': ('float32', (0.0, 100.0)),
+    },
+    'yearly_trends': {
+        'year': ('int16', (1800, 2100)),
+        'total_ratings': COUNT,
+        'avg_rating': RATING,
+        'active_users': COUNT,
+    },
+    'genre_stats': {
+        'genre': CATEGORY,
+        'avg_rating': RATING,
+        'num_ratings': COUNT,
+        'std_rating': REAL,
+    },
+    'hidden_gems': {
+        'movieId': COUNT,
+        'title': STRING,
+        'genres': CATEGORY,
+        'release_year': YEAR,
+        'avg_rating': RATING,
+        'num_ratings': COUNT,
+        'rating_std': REAL,
+    },
+    'top_movies': {
+        'movieId': COUNT,
+        'avg_rating': RATING,
+        'num_ratings': COUNT,
+        'rating_std': REAL,
+        'title': STRING,
+        'genres': CATEGORY,
+        'release_year': YEAR,
+        'content_type': CATEGORY,
+    },
+    'genre_pairs': {
+        'genre_a': CATEGORY,
+        'genre_b': CATEGORY,
+        'num_movies': COUNT,
+        'num_ratings': COUNT,
+        'avg_rating': RATING,
+        'user_affinity': ('float32', (0.0, 1.0)),
+    },
+    'release_years': {
+        'release_year': ('int16', (1800, 2100)),
+        'num_movies': COUNT,
+        'num_ratings': COUNT,
+        'avg_rating': RATING,
+        'std_rating': REAL,
+        'avg_movie_rating': RATING,
+        'avg_rating_lag': REAL,
+    },
+    'release_decades': {
+        'decade': ('int16', (1800, 2100)),
+        'num_movies': COUNT,
+        'num_ratings': COUNT,
+        'avg_rating': RATING,
+        'std_rating': REAL,
+        'avg_movie_rating': RATING,
+        'avg_rating_lag': REAL,
+    },
+    # Per-movie aggregates behind the leaderboards (one row per title).
+    'movie_stats': {
+        'movieId': COUNT,
+        'title': STRING,
+        'genres': CATEGORY,
+        'avg_rating': RATING,
+        'num_ratings': COUNT,
+        'rating_std': REAL,
+    },
+}
+
+
+class SchemaError(ValueError):
+    """Raised when a table does not match its schema."""
+
+
+def _convert(name, column, series, kind):
+    if kind == 'category':
+        return series.astype('category')
+    if kind == 'string':
+        return series.astype('string[pyarrow]')
+    if kind == 'year':
+        values = pd.to_numeric(series, errors='coerce')
+        if not (values.dropna() % 1 == 0).all():
+            raise SchemaError(f"{name}.{column}: non-integer years")
+        return values.fillna(YEAR_MISSING).astype(np.int16)
+    values = pd.to_numeric(series, errors='raise')
+    if kind.startswith('int'):
+        if values.isna().any():
+            raise SchemaError(f"{name}.{column}: missing values in an integer column")
+        info = np.iinfo(kind)
+        if len(values) and (values.min() < info.min or values.max() > info.max):
+            raise SchemaError(f"{name}.{column}: values out of {kind} range")
+    return values.astype(kind)
+
+
+def apply(name, df):
+    """Validate ``df`` against the schema for ``name`` and compact it.
+
+    Columns not in the schema are kept unchanged. Returns the new frame.
+    """
+    schema = SCHEMAS.get(name)
+    if schema is None:
+        return df
+    missing = [column for column in schema if column not in df.columns]
+    if missing:
+        raise SchemaError(f"{name}: missing columns {missing}")
+
+    out = df.copy()
+    for column, (kind, bounds) in schema.items():
+        try:
+            out[column] = _convert(name, column, df[column], kind)
+        except (TypeError, ValueError) as e:
+            if isinstance(e, SchemaError):
+                raise
+            raise SchemaError(f"{name}.{column}: cannot convert to {kind}: {e}") from e
+        if bounds is not None:
+            values = out[column]
+            if kind == 'year':
+                values = values[values != YEAR_MISSING]
+            low, high = bounds
+            if (low is not None and (values < low).any()) or (high is not None and (values > high).any()):
+                raise SchemaError(f"{name}.{column}: values outside [{low}, {high}]")
+    return out
+
+
+def memory_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+def apply_all(tables, optional=()):
+    """Compact every table; returns ``(tables, report)``.
+
+    ``report`` maps each table name to ``(bytes_before, bytes_after)``. A
+    table named in ``optional`` that fails validation is dropped with a
+    warning instead of failing the whole set.
+    """
+    compact, report = {}, {}
+    for name, df in tables.items():
+        try:
+            compact[name] = apply(name, df)
+        except SchemaError as e:
+            if name not in optional:
+                raise
+            logger.warning("Dropping optional table %s: %s", name, e)
+            continue
+        report[name] = (memory_bytes(df), memory_bytes(compact[name]))
+    return compact, report
+
+
+def for_display(df):
+    """Copy of ``df`` with year sentinels turned back into missing values."""
+    years = [c for c in df.columns if c == 'release_year' and df[c].dtype == np.int16]
+    if not years:
+        return df
+    out = df.copy()
+    for column in years:
+        out[column] = out[column].astype('Int16').mask(out[column] == YEAR_MISSING)
+    return out
@@ -0,0 +1,27 @@
+"""Start the dashboard with its data warmed before the first request.
+
+``streamlit run`` only executes app code when a session connects, so the
+first visitor after a deploy would wait for the data store to build. This
+launcher starts that build in a background thread, then runs the Streamlit
+server in the same process::
+
+    python -m utils.serve [streamlit run options]
+"""
+
+import sys
+
+from streamlit.web import cli as stcli
+
+from utils import data_store
+
+MAIN_SCRIPT = 'app.py'
+
+
+def main(argv=None):
+    data_store.warm()
+    sys.argv = ['streamlit', 'run', MAIN_SCRIPT, *(sys.argv[1:] if argv is None else argv)]
+    sys.exit(stcli.main())
+
+
+if __name__ == '__main__':
+    main()
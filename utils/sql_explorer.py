@@ -0,0 +1,244 @@
+"""Embedded DuckDB engine behind the SQL Explorer page.
+
+Summary tables from the current data snapshot are loaded as tables. If the
+raw MovieLens tables have been exported as Parquet under ``assets/data/raw``,
+they are exposed as the columnar ``ratings`` and ``movies`` views. Results
+are cached by normalized SQL, parameters, row limit and data version, and
+every query runs read-only with a row limit and a timeout.
+"""
+
+import os
+import re
+import threading
+import time
+
+import duckdb
+import streamlit as st
+
+from utils import data_store, instrumentation, schema
+
+RAW_DIR = data_store.RAW_DIR
+RAW_TABLES = {
+    'ratings': os.path.join(RAW_DIR, 'ratings.parquet'),
+    'movies': os.path.join(RAW_DIR, 'movies.parquet'),
+}
+DEFAULT_ROW_LIMIT = 1000
+DEFAULT_TIMEOUT_SECONDS = 30
+
+
+class QueryError(Exception):
+    """Raised for rejected, failed or timed-out queries."""
+
+
+# ============================================================================
+# TEMPLATES
+# ============================================================================
+
+# Each template is parameterized with DuckDB ``$name`` placeholders; ``params``
+# holds the defaults and ``requires`` the views that must exist.
+TEMPLATES = {
+    "Average rating by genre for users who joined after a year": {
+        'requires': ['ratings', 'movies'],
+        'params': {'joined_after': 2015},
+        'sql': """
+WITH first_seen AS (
+    SELECT userId, year(min(to_timestamp("timestamp"))) AS joined_year
+    FROM ratings
+    GROUP BY userId
+),
+movie_genres AS (
+    SELECT movieId, unnest(string_split(genres, '|')) AS genre
+    FROM movies
+)
+SELECT g.genre, avg(r.rating) AS avg_rating, count(*) AS num_ratings
+FROM ratings r
+JOIN first_seen f USING (userId)
+JOIN movie_genres g USING (movieId)
+WHERE f.joined_year > $joined_after
+GROUP BY g.genre
+ORDER BY avg_rating DESC
+""",
+    },
+    "Rating volume by year for one genre": {
+        'requires': ['ratings', 'movies'],
+        'params': {'genre': 'Drama'},
+        'sql': """
+SELECT year(to_timestamp(r."timestamp")) AS year,
+       count(*) AS num_ratings,
+       avg(r.rating) AS avg_rating,
+       count(DISTINCT r.userId) AS active_users
+FROM ratings r
+JOIN movies m USING (movieId)
+WHERE list_contains(string_split(m.genres, '|'), $genre)
+GROUP BY year
+ORDER BY year
+""",
+    },
+    "Yearly trends in a year range": {
+        'requires': ['yearly_trends'],
+        'params': {'start_year': 2000, 'end_year': 2023},
+        'sql': """
+SELECT year, total_ratings, avg_rating, active_users
+FROM yearly_trends
+WHERE year BETWEEN $start_year AND $end_year
+ORDER BY year
+""",
+    },
+    "Genres with at least N ratings": {
+        'requires': ['genre_stats'],
+        'params': {'min_ratings': 1000000},
+        'sql': """
+SELECT genre, avg_rating, num_ratings, std_rating
+FROM genre_stats
+WHERE num_ratings >= $min_ratings
+ORDER BY avg_rating DESC
+""",
+    },
+    "Hidden gems in a genre": {
+        'requires': ['hidden_gems'],
+        'params': {'genre': 'Documentary'},
+        'sql': """
+SELECT title, release_year, avg_rating, num_ratings
+FROM hidden_gems
+WHERE list_contains(string_split(genres, '|'), $genre)
+ORDER BY avg_rating DESC, num_ratings DESC
+""",
+    },
+}
+
+
+# String literals and quoted identifiers (kept verbatim), or runs of comments
+# and whitespace, matched left to right so quotes inside comments and comment
+# markers inside strings are handled.
+_SQL_TOKENS = re.compile(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|(?:\s|--[^\n]*|/\*.*?\*/)+""", re.DOTALL)
+
+
+def normalize_sql(sql):
+    """Cache key for ``sql``: comments and whitespace outside quotes become one space.
+
+    Only used to compare queries; the original text is what gets executed.
+    """
+    key = _SQL_TOKENS.sub(lambda m: m.group() if m.group()[0] in "'\"" else " ", sql)
+    return key.strip().rstrip(';').strip()
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+def raw_version():
+    """Fingerprint of the raw Parquet files, which live outside snapshots."""
+    parts = []
+    for name, path in sorted(RAW_TABLES.items()):
+        try:
+            stat = os.stat(path)
+            parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            pass
+    return ",".join(parts)
+
+
+def build_engine(summary):
+    """Read-only DuckDB database over ``summary``: ``(connection, tables)``.
+
+    Built with each data snapshot (see ``utils.data_store``). The connection
+    is shared by every session, so callers must query through their own
+    ``con.cursor()``. ``tables`` maps each table or view name to its
+    ``(column, type)`` list, read once here for the same reason.
+    """
+    con = duckdb.connect()
+    # Registered frames are only visible to this connection, not to the
+    # per-query cursors, so copy the (small) summary tables into the database.
+    for name, df in (summary or {}).items():
+        con.register('_frame', schema.for_display(df))
+        con.execute(f"CREATE TABLE {name} AS SELECT * FROM _frame")
+        con.unregister('_frame')
+    for name, path in RAW_TABLES.items():
+        if os.path.exists(path):
+            con.execute(
+                f"CREATE VIEW {name} AS SELECT * FROM read_parquet('{os.path.abspath(path)}')"
+            )
+    tables = {}
+    for table, column, dtype in con.execute(
+        "SELECT table_name, column_name, data_type FROM information_schema.columns "
+        "ORDER BY table_name, ordinal_position"
+    ).fetchall():
+        tables.setdefault(table, []).append((column, dtype))
+    # Timestamps are Unix seconds bucketed in UTC, as the offline builds do,
+    # not in the server's local time zone (GLOBAL, so query cursors see it).
+    con.execute("SET GLOBAL TimeZone='UTC'")
+    # Lock the engine down: no file access outside the data directory and no
+    # way to change that from a query.
+    con.execute(f"SET allowed_directories=['{os.path.abspath(RAW_DIR)}']")
+    con.execute("SET enable_external_access=false")
+    con.execute("SET lock_configuration=true")
+    return con, tables
+
+
+def current_engine():
+    """Return ``(connection, tables, data_version)`` for this script run."""
+    snapshot = data_store.current()
+    data_version = f"{snapshot.version}|{raw_version()}"
+    con, tables = snapshot.engine or _fallback_engine(snapshot.version, snapshot)
+    return con, tables, data_version
+
+
+@st.cache_resource(max_entries=2)
+def _fallback_engine(version, _snapshot):
+    # Only used if building the engine with the snapshot failed.
+    instrumentation.mark_miss()
+    return build_engine(_snapshot.summary)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _run_cached(sql_key, _sql, params, row_limit, timeout_seconds, data_version, _con):
+    instrumentation.mark_miss()
+    sql = _sql.strip().rstrip(';')
+    cursor = _con.cursor()
+
+    statements = cursor.extract_statements(sql)
+    if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+        raise QueryError("Only a single SELECT statement is allowed.")
+
+    timer = threading.Timer(timeout_seconds, cursor.interrupt)
+    start = time.perf_counter()
+    timer.start()
+    try:
+        result = cursor.execute(
+            # Newlines keep a trailing ``--`` comment from swallowing the wrapper.
+            f"SELECT * FROM (\n{sql}\n) LIMIT {int(row_limit) + 1}", dict(params)
+        ).df()
+    except duckdb.InterruptException:
+        raise QueryError(f"Query exceeded the {timeout_seconds}s timeout.")
+    except duckdb.Error as e:
+        raise QueryError(str(e))
+    finally:
+        timer.cancel()
+        cursor.close()
+
+    return {
+        'df': result.head(row_limit),
+        'truncated': len(result) > row_limit,
+        'seconds': time.perf_counter() - start,
+        'computed_at': time.time(),
+    }
+
+
+def run_query(sql, params=None, row_limit=DEFAULT_ROW_LIMIT, timeout_seconds=DEFAULT_TIMEOUT_SECONDS):
+    """Run ``sql`` with ``$name`` parameters; repeated queries hit the cache.
+
+    Returns a dict with the result ``df``, whether it was ``truncated`` to
+    ``row_limit``, the engine ``seconds`` and whether it was ``cached``.
+    """
+    # The connection must be the one ``data_version`` names, or a refresh in
+    # between would cache new data under the old version.
+    con, _, data_version = current_engine()
+    sql_key = normalize_sql(sql)
+    # Only pass parameters the statement actually references.
+    params = tuple(sorted(
+        (k, v) for k, v in (params or {}).items() if re.search(rf"\${k}\b", sql_key)
+    ))
+    requested_at = time.time()
+    with instrumentation.track("loader", "sql_query"):
+        result = _run_cached(sql_key, sql, params, row_limit, timeout_seconds, data_version, con)
+    return dict(result, cached=result['computed_at'] < requested_at)
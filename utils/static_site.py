@@ -0,0 +1,464 @@
+"""Pre-render the dashboard into a self-contained static site.
+
+Every read-only section (metrics, visualizations, tables, heatmaps,
+leaderboards and export files) is rendered to plain HTML from one data
+snapshot. Sections are submitted to a thread pool, but pandas and plotly
+rendering holds the GIL, so the pool mostly overlaps asset copies and file
+writes with rendering rather than rendering sections in parallel. The output
+only needs a static file server; the live Streamlit app remains for the
+interactive features (leaderboard filters, SQL Explorer, quick slices,
+diagnostics).
+
+The output path is a symlink to a build directory in ``<out>.builds/``. A
+new build is written there and swapped in by atomically replacing the
+symlink, so a server following it sees either the old or the new site, never
+a missing or partial one. The previous build is kept for requests in flight.
+
+Layout of a build::
+
+    index.html               main dashboard
+    business_insights.html   all tabs as anchored sections
+    static/                  shared stylesheet and plotly.js
+    viz/                     HTML visualizations and images (iframed)
+    downloads/               CSV exports
+
+Build it with::
+
+    python -m utils.static_site build site/
+"""
+
+import argparse
+import html
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from plotly.offline import get_plotlyjs
+
+from utils import content, data_store, genre_matrix, leaderboard, release_year, schema
+
+STYLE = """
+body { background-color: #141414; color: #FFFFFF; font-family: 'Helvetica Neue', Arial, sans-serif; margin: 0; }
+main { max-width: 1400px; margin: 0 auto; padding: 1rem 2rem; }
+h1, h2, h3, h4 { color: #FFFFFF; }
+h1 { color: #E50914; font-weight: 700; text-transform: uppercase; letter-spacing: 2px; }
+a { color: #E50914; text-decoration: none; }
+a:hover { color: #F40612; text-decoration: underline; }
+hr { border: none; border-top: 1px solid #333; margin: 2rem 0; }
+nav.tabs { position: sticky; top: 0; background: #000000; border-bottom: 2px solid #E50914; padding: 0.75rem 2rem; z-index: 1; }
+nav.tabs a { margin-right: 1.5rem; font-weight: 600; }
+.header { text-align: center; padding: 1.5rem 0; }
+.header p { color: #999; font-size: 1.1rem; }
+.row { display: flex; gap: 1.5rem; flex-wrap: wrap; }
+.row > * { flex: 1 1 0; min-width: 250px; }
+.metric .label { font-size: 0.9rem; }
+.metric .value { color: #E50914; font-size: 2rem; font-weight: 700; }
+.metric .delta { color: #21c354; font-size: 0.85rem; }
+iframe { width: 100%; border: none; background: #141414; }
+img { max-width: 100%; }
+table.table { border-collapse: collapse; width: 100%; font-size: 0.9rem; }
+table.table th { text-align: left; border-bottom: 2px solid #E50914; padding: 0.4rem; }
+table.table td { border-bottom: 1px solid #333; padding: 0.4rem; }
+.scroll { max-height: 420px; overflow-y: auto; }
+.button { display: inline-block; background-color: #E50914; color: white; border-radius: 4px; padding: 10px 24px; font-weight: 600; margin: 0 0.5rem 0.75rem 0; }
+.button:hover { background-color: #F40612; color: white; text-decoration: none; }
+.note { color: #999; font-style: italic; }
+details summary { cursor: pointer; font-weight: 600; margin: 0.5rem 0; }
+"""
+
+# (title, path, height) per section, matching pages/business_insights.py.
+VIZ = {
+    'user_behavior': [
+        ("User Rating Distribution", 'user_behavior/overview.html', 550),
+        ("Rating Trends Over Time (1995-2023)", 'user_behavior/temporal_trends.html', 850),
+        ("User Retention Analysis", 'user_behavior/retention.html', 550),
+        ("Monthly Activity Patterns", 'user_behavior/monthly_patterns.html', 550),
+        ("Hourly Activity Patterns", 'user_behavior/hourly_patterns.html', 550),
+    ],
+    'content_performance': [
+        ("Genre Performance Analysis", 'content_performance/genre_performance.html', 700),
+        ("Tag Sentiment Analysis", 'content_performance/tag_sentiment.html', 550),
+        ("Release Year Impact Analysis", 'content_performance/release_year_impact.html', 900),
+        ("Movie Polarization Analysis", 'content_performance/polarization.html', 650),
+    ],
+    'hidden_gems': [
+        ("Top Hidden Gems", 'hidden_gems/gems_analysis.html', 800),
+    ],
+    'user_personas': [
+        ("User Persona Distribution", 'user_personas/persona_clusters.html', 800),
+    ],
+}
+
+EXPORTS = [
+    ("📈 Platform Statistics", 'platform_stats'),
+    ("👥 User Segments", 'user_segments'),
+    ("📅 Yearly Trends", 'yearly_trends'),
+    ("🎭 Genre Statistics", 'genre_stats'),
+    ("💎 Hidden Gems", 'hidden_gems'),
+    ("🏆 Top Movies", 'top_movies'),
+]
+# Builds kept in ``<out>.builds/``: the live one and its predecessor.
+KEEP_BUILDS = 2
+
+
+# ============================================================================
+# BUILDING BLOCKS
+# ============================================================================
+
+def _metrics(items):
+    cells = "".join(
+        f"<div class='metric'><div class='label'>{html.escape(label)}</div>"
+        f"<div class='value'>{html.escape(str(value))}</div>"
+        + (f"<div class='delta'>↑ {html.escape(delta)}</div>" if delta else "")
+        + "</div>"
+        for label, value, delta in items
+    )
+    return f"<div class='row'>{cells}</div>"
+
+
+def _row(*blocks):
+    return "<div class='row'>" + "".join(f"<div>{b}</div>" for b in blocks) + "</div>"
+
+
+def _table(df, scroll=True):
+    table = df.to_html(classes='table', index=False, border=0, na_rep='')
+    return f"<div class='scroll'>{table}</div>" if scroll else table
+
+
+def _viz(snapshot, relpath, height):
+    path = f"{data_store.VIZ_DIR}/{relpath}"
+    if path not in snapshot.html:
+        return f"<p class='note'>Visualization not available: {html.escape(relpath)}</p>"
+    return f"<iframe src='viz/{relpath}' height='{height}' loading='lazy'></iframe>"
+
+
+def _viz_block(snapshot, section, indices=None):
+    items = VIZ[section]
+    return "<hr>".join(
+        f"<h3>{html.escape(title)}</h3>{_viz(snapshot, path, height)}"
+        for i, (title, path, height) in enumerate(items)
+        if indices is None or i in indices
+    )
+
+
+def _figure(fig):
+    return fig.to_html(full_html=False, include_plotlyjs=False)
+
+
+def _page(title, body, nav=""):
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<link rel="stylesheet" href="static/style.css">
+<script src="static/plotly.min.js"></script>
+</head>
+<body>
+{nav}
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+# ============================================================================
+# SECTIONS
+# ============================================================================
+
+def _platform_stats(snapshot):
+    if snapshot.summary is None:
+        return {'total_ratings': '33.8M', 'total_users': '331K', 'total_movies': '86K', 'avg_rating': 3.53}
+    return snapshot.summary['platform_stats'].iloc[0]
+
+
+def section_home(snapshot, out_dir):
+    stats = _platform_stats(snapshot)
+    return f"""
+<div class='header'>
+    <h1 style='font-size: 3.5rem; margin-bottom: 0.5rem;'>🎬 MOVIELENS ANALYTICS DASHBOARD</h1>
+    <p>Powered by 33M+ Ratings | Machine Learning Final Project</p>
+</div>
+<hr>
+<h2 style='text-align: center;'>PLATFORM OVERVIEW</h2>
+{_metrics([
+    ("Total Ratings", stats['total_ratings'], "33.8M analyzed"),
+    ("Active Users", stats['total_users'], "331K profiles"),
+    ("Movies Analyzed", stats['total_movies'], "86K titles"),
+    ("Avg Rating", f"{stats['avg_rating']:.2f}★", "Quality content"),
+])}
+<hr>
+<div class='row'>
+    <div style='flex: 2;'><h2>PROJECT OVERVIEW</h2>{content.PROJECT_OVERVIEW}</div>
+    <div><h2>NAVIGATION</h2>{content.NAVIGATION}</div>
+</div>
+<hr>
+<h2 style='text-align: center;'>KEY INSIGHTS</h2>
+{_row(*content.HOME_INSIGHTS)}
+<hr>
+<p style='text-align: center;'><a class='button' href='business_insights.html'>Go to Business Insights</a></p>
+"""
+
+
+def section_summary(snapshot, out_dir):
+    stats = _platform_stats(snapshot)
+    gems = len(snapshot.summary['hidden_gems']) if snapshot.summary is not None else 0
+    return f"""
+<div class='header'>
+    <h1 style='font-size: 3rem;'>📊 BUSINESS INSIGHTS &amp; ANALYTICS</h1>
+    <p>Comprehensive Analysis of 33.8M Ratings | 331K Users | 86K Movies</p>
+</div>
+<hr>
+{_metrics([
+    ("Total Ratings", stats['total_ratings'], None),
+    ("Active Users", stats['total_users'], None),
+    ("Movies", stats['total_movies'], None),
+    ("Avg Rating", f"{stats['avg_rating']:.2f}★", None),
+    ("Hidden Gems", gems, None),
+])}
+"""
+
+
+def section_user_behavior(snapshot, out_dir):
+    monthly, hourly = VIZ['user_behavior'][3:5]
+    return f"""
+<h2 id='user_behavior'>👥 User Behavior Analysis</h2>
+{content.INTRO_USER_BEHAVIOR}
+{_viz_block(snapshot, 'user_behavior', indices={0, 1, 2})}
+<hr>
+{_row(
+    f"<h3>{monthly[0]}</h3>{_viz(snapshot, monthly[1], monthly[2])}",
+    f"<h3>{hourly[0]}</h3>{_viz(snapshot, hourly[1], hourly[2])}",
+)}
+<hr>
+<h3>Key Insights</h3>
+{_row(*content.USER_BEHAVIOR_INSIGHTS)}
+"""
+
+
+def section_content_performance(snapshot, out_dir):
+    summary = snapshot.summary or {}
+    genre_pairs = ""
+    if 'genre_pairs' in summary:
+        pairs = summary['genre_pairs']
+        combos = pairs[(pairs['genre_a'] != pairs['genre_b']) & (pairs['num_ratings'] >= 10000)]
+        genre_pairs = f"""
+<hr>
+<h3>Genre Combinations &amp; Audience Overlap</h3>
+{_row(
+    _figure(genre_matrix.heatmap(pairs, 'avg_rating', "Avg Rating", "Average rating of movies carrying both genres")),
+    _figure(genre_matrix.heatmap(pairs, 'user_affinity', "Affinity", "Audience overlap (cosine similarity of user genre profiles)")),
+)}
+<h4>Best-Performing Genre Pairs</h4>
+{_table(combos.nlargest(15, 'avg_rating'), scroll=False)}
+"""
+    wordcloud = f"{data_store.VIZ_DIR}/content_performance/tag_wordcloud.png"
+    if wordcloud in snapshot.images:
+        cloud = "<img src='viz/content_performance/tag_wordcloud.png' alt='Popular movie tags'>"
+    else:
+        cloud = "<p class='note'>Word cloud not available.</p>"
+    if 'release_years' in summary and 'release_decades' in summary:
+        release = f"""
+<h3>Release Year Impact Analysis</h3>
+{_row(
+    _figure(release_year.figure(summary['release_decades'], 'decade', "Ratings by release decade")),
+    _figure(release_year.figure(summary['release_years'], 'release_year', "Ratings by release year")),
+)}
+"""
+    else:
+        release = _viz_block(snapshot, 'content_performance', indices={2})
+    sentiment = VIZ['content_performance'][1]
+    return f"""
+<h2 id='content_performance'>🎬 Content Performance &amp; Tag Analysis</h2>
+{content.INTRO_CONTENT_PERFORMANCE}
+{_viz_block(snapshot, 'content_performance', indices={0})}
+{genre_pairs}
+<hr>
+{_row(f"<h3>{sentiment[0]}</h3>{_viz(snapshot, sentiment[1], sentiment[2])}", f"<h3>Popular Movie Tags</h3>{cloud}")}
+<hr>
+{release}
+<hr>
+{_viz_block(snapshot, 'content_performance', indices={3})}
+<hr>
+<h3>Premium Effect: Technical Format Impact</h3>
+{content.PREMIUM_EFFECT}
+<hr>
+<h3>Key Insights</h3>
+{_row(*content.CONTENT_INSIGHTS)}
+"""
+
+
+def section_hidden_gems(snapshot, out_dir):
+    body = ""
+    if snapshot.summary is not None:
+        gems = snapshot.summary['hidden_gems']
+        top_genre = gems['genres'].str.split('|').explode().value_counts().index[0]
+        body = f"""
+<hr>
+<h3>Hidden Gems Database</h3>
+{_table(schema.for_display(gems.head(50)[['title', 'genres', 'release_year', 'avg_rating', 'num_ratings']]))}
+<hr>
+{_metrics([
+    ("Total Hidden Gems", len(gems), None),
+    ("Avg Rating", f"{gems['avg_rating'].mean():.2f}★", None),
+    ("Avg Reviews", f"{gems['num_ratings'].mean():.0f}", None),
+    ("Top Genre", top_genre, None),
+])}
+"""
+    return f"""
+<h2 id='hidden_gems'>💎 Hidden Gems Discovery</h2>
+{content.INTRO_HIDDEN_GEMS}
+{_viz_block(snapshot, 'hidden_gems')}
+{body}
+"""
+
+
+def section_leaderboards(snapshot, out_dir):
+    table = snapshot.movie_table
+    if table is None:
+        return ""
+    per_genre = "".join(
+        f"<details><summary>{html.escape(genre)}</summary>"
+        f"{_table(table.top_k(10, genre=genre, min_ratings=50), scroll=False)}</details>"
+        for genre in table.genre_names
+    )
+    return f"""
+<h2 id='leaderboards'>🏆 Movie Leaderboards</h2>
+{content.INTRO_LEADERBOARDS}
+<h3>Top 20 Overall</h3>
+<p class='note'>Prior weight {leaderboard.DEFAULT_PRIOR_WEIGHT} ratings at the platform mean of {table.prior_mean:.2f}★, minimum 50 ratings.</p>
+{_table(table.top_k(20, min_ratings=50), scroll=False)}
+<h3>Top 10 per Genre</h3>
+{per_genre}
+"""
+
+
+def section_user_personas(snapshot, out_dir):
+    return f"""
+<h2 id='user_personas'>🎭 User Personas &amp; Segmentation</h2>
+{content.INTRO_USER_PERSONAS}
+{_viz_block(snapshot, 'user_personas')}
+<hr>
+<h3>Persona Profiles</h3>
+{_row(*content.PERSONAS)}
+"""
+
+
+def section_export_data(snapshot, out_dir):
+    if snapshot.summary is None:
+        return ""
+    downloads = os.path.join(out_dir, 'downloads')
+    os.makedirs(downloads, exist_ok=True)
+    links = []
+    for label, name in EXPORTS:
+        with open(os.path.join(downloads, f"{name}.csv"), 'wb') as f:
+            f.write(data_store.source_csv(snapshot, name))
+        links.append(f"<a class='button' href='downloads/{name}.csv' download>{label}</a>")
+    return f"""
+<h2 id='export_data'>📥 Export &amp; Download Data</h2>
+{content.INTRO_EXPORT_DATA}
+{_row("<h3>📊 Available Datasets</h3>" + "".join(links[:3]), "<h3>🎬 Content Data</h3>" + "".join(links[3:]))}
+"""
+
+
+TABS = [
+    ('user_behavior', "👥 User Behavior", section_user_behavior),
+    ('content_performance', "🎬 Content Performance", section_content_performance),
+    ('hidden_gems', "💎 Hidden Gems", section_hidden_gems),
+    ('leaderboards', "🏆 Leaderboards", section_leaderboards),
+    ('user_personas', "🎭 User Personas", section_user_personas),
+    ('export_data', "📥 Export Data", section_export_data),
+]
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def _write_assets(snapshot, out_dir):
+    static = os.path.join(out_dir, 'static')
+    os.makedirs(static, exist_ok=True)
+    with open(os.path.join(static, 'style.css'), 'w', encoding='utf-8') as f:
+        f.write(STYLE)
+    with open(os.path.join(static, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+        f.write(get_plotlyjs())
+    for path, text in snapshot.html.items():
+        target = os.path.join(out_dir, 'viz', os.path.relpath(path, data_store.VIZ_DIR))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(text)
+    for path in snapshot.images:
+        target = os.path.join(out_dir, 'viz', os.path.relpath(path, data_store.VIZ_DIR))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Copy the original bytes: re-saving would re-encode JPEGs lossily.
+        shutil.copyfile(snapshot.files[path], target)
+    return ""
+
+
+def _swap_symlink(out_dir, build_dir):
+    """Atomically point the ``out_dir`` symlink at ``build_dir``."""
+    if os.path.isdir(out_dir) and not os.path.islink(out_dir):
+        # A plain directory from an older build: move it aside once. This
+        # migration is the only time ``out_dir`` is briefly missing.
+        os.rename(out_dir, os.path.join(os.path.dirname(build_dir), '00000000T000000-legacy'))
+    link = f"{out_dir}.tmp-{os.getpid()}"
+    if os.path.lexists(link):
+        os.remove(link)
+    os.symlink(os.path.relpath(build_dir, os.path.dirname(os.path.abspath(out_dir))), link)
+    os.replace(link, out_dir)
+
+
+def build(out_dir, workers=None):
+    """Render the whole site, point ``out_dir`` at it and return the data version."""
+    snapshot = data_store.build_snapshot()
+    out_dir = out_dir.rstrip(os.sep)
+    builds = f"{out_dir}.builds"
+    staging = os.path.join(builds, f"{time.strftime('%Y%m%dT%H%M%S')}-{snapshot.version}-{os.getpid()}")
+    os.makedirs(staging)
+
+    jobs = [_write_assets, section_home, section_summary] + [fn for _, _, fn in TABS]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(job, snapshot, staging) for job in jobs]
+        _, home, summary, *tabs = [future.result() for future in futures]
+
+    footer = "<hr><p style='text-align: center; color: #666;'>Static snapshot of data version {} • built {}</p>".format(
+        snapshot.version, time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime())
+    )
+    nav = "<nav class='tabs'><a href='index.html'>🏠 Home</a>" + "".join(
+        f"<a href='business_insights.html#{key}'>{label}</a>" for key, label, _ in TABS
+    ) + "</nav>"
+    pages = {
+        'index.html': _page("MovieLens Analytics Dashboard", home + footer, nav),
+        'business_insights.html': _page(
+            "Business Insights | MovieLens Dashboard",
+            summary + "".join(f"<hr>{tab}" for tab in tabs if tab) + footer,
+            nav,
+        ),
+    }
+    for name, page in pages.items():
+        with open(os.path.join(staging, name), 'w', encoding='utf-8') as f:
+            f.write(page)
+
+    _swap_symlink(out_dir, staging)
+    # Build names start with a timestamp, so the newest sort last.
+    for name in sorted(os.listdir(builds))[:-KEEP_BUILDS]:
+        shutil.rmtree(os.path.join(builds, name), ignore_errors=True)
+    return snapshot.version
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a static snapshot of the dashboard.")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('out_dir')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+    version = build(args.out_dir, args.workers)
+    print(f"Built static site for data version {version} in {args.out_dir}")
+
+
+if __name__ == '__main__':
+    main()